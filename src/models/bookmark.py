@@ -2,9 +2,27 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from itertools import chain
+from typing import Optional, List, Set
 import sqlite3
 
+from ..utils.url import normalize_url
+
+
+_INSERT_PREFIX = """
+    INSERT INTO bookmarks
+    (url, title, description, notes, favicon_url, folder_id,
+     browser_profile_id, browser_bookmark_id, browser_added_at, position,
+     normalized_url)
+    VALUES """
+_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_SQL = _INSERT_PREFIX + _ROW_PLACEHOLDERS
+
+# Rows per multi-row INSERT; 90 rows of 11 parameters stay under the 999
+# parameter limit of older SQLite builds
+_ROWS_PER_INSERT = 90
+_INSERT_MANY_SQL = _INSERT_PREFIX + ", ".join([_ROW_PLACEHOLDERS] * _ROWS_PER_INSERT)
+
 
 @dataclass
 class Bookmark:
@@ -49,6 +67,41 @@ class Bookmark:
             else None,
         )
 
+    def _insert_params(self) -> tuple:
+        """Parameters for _INSERT_SQL."""
+        return (
+            self.url,
+            self.title,
+            self.description,
+            self.notes,
+            self.favicon_url,
+            self.folder_id,
+            self.browser_profile_id,
+            self.browser_bookmark_id,
+            self.browser_added_at.isoformat() if self.browser_added_at else None,
+            self.position,
+            normalize_url(self.url),
+        )
+
+    @classmethod
+    def insert_many(cls, db, bookmarks: List["Bookmark"]):
+        """Insert new bookmarks with multi-row INSERT statements.
+
+        Each statement writes _ROWS_PER_INSERT rows, so the statement
+        overhead is paid once per chunk rather than per bookmark. The
+        bookmarks' bookmark_id is left unset.
+        """
+        for start in range(0, len(bookmarks), _ROWS_PER_INSERT):
+            chunk = bookmarks[start:start + _ROWS_PER_INSERT]
+            if len(chunk) == _ROWS_PER_INSERT:
+                sql = _INSERT_MANY_SQL
+            else:
+                sql = _INSERT_PREFIX + ", ".join([_ROW_PLACEHOLDERS] * len(chunk))
+            db.execute(sql, tuple(chain.from_iterable(
+                bookmark._insert_params() for bookmark in chunk
+            )))
+        db.commit()
+
     def save(self, db) -> "Bookmark":
         """Save the bookmark to the database."""
         browser_added_str = (
@@ -56,26 +109,7 @@ class Bookmark:
         )
 
         if self.bookmark_id is None:
-            cursor = db.execute(
-                """
-                INSERT INTO bookmarks
-                (url, title, description, notes, favicon_url, folder_id,
-                 browser_profile_id, browser_bookmark_id, browser_added_at, position)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    self.url,
-                    self.title,
-                    self.description,
-                    self.notes,
-                    self.favicon_url,
-                    self.folder_id,
-                    self.browser_profile_id,
-                    self.browser_bookmark_id,
-                    browser_added_str,
-                    self.position,
-                ),
-            )
+            cursor = db.execute(_INSERT_SQL, self._insert_params())
             db.commit()
             self.bookmark_id = cursor.lastrowid
         else:
@@ -85,7 +119,8 @@ class Bookmark:
                 SET url = ?, title = ?, description = ?, notes = ?,
                     favicon_url = ?, folder_id = ?, browser_profile_id = ?,
                     browser_bookmark_id = ?, browser_added_at = ?,
-                    position = ?, updated_at = CURRENT_TIMESTAMP
+                    position = ?, normalized_url = ?,
+                    updated_at = CURRENT_TIMESTAMP
                 WHERE bookmark_id = ?
                 """,
                 (
@@ -99,6 +134,7 @@ class Bookmark:
                     self.browser_bookmark_id,
                     browser_added_str,
                     self.position,
+                    normalize_url(self.url),
                     self.bookmark_id,
                 ),
             )
@@ -127,6 +163,15 @@ class Bookmark:
         row = cursor.fetchone()
         return cls.from_row(row) if row else None
 
+    @classmethod
+    def get_browser_ids(cls, db, browser_profile_id: int) -> Set[str]:
+        """Get the browser bookmark IDs already stored for a profile."""
+        cursor = db.execute(
+            "SELECT browser_bookmark_id FROM bookmarks WHERE browser_profile_id = ?",
+            (browser_profile_id,),
+        )
+        return {row[0] for row in cursor}
+
     @classmethod
     def find_by_url(cls, db, url: str) -> List["Bookmark"]:
         """Find all bookmarks with a specific URL."""
@@ -1,6 +1,7 @@
 """SQLite database connection and setup."""
 
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 import os
@@ -24,11 +25,15 @@ class Database:
 
         self.db_path = Path(db_path)
         self.connection: Optional[sqlite3.Connection] = None
+        # Nesting depth of transaction() blocks; commit() waits for zero
+        self._transaction_depth = 0
 
     def connect(self) -> sqlite3.Connection:
         """Establish database connection."""
         if self.connection is None:
-            self.connection = sqlite3.connect(str(self.db_path))
+            # A larger statement cache keeps the prepared INSERT/lookup
+            # statements of bulk imports from being re-parsed per row
+            self.connection = sqlite3.connect(str(self.db_path), cached_statements=256)
             self.connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
@@ -94,11 +99,18 @@ class Database:
                 position INTEGER DEFAULT 0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                normalized_url TEXT,
                 FOREIGN KEY (folder_id) REFERENCES folders(folder_id) ON DELETE SET NULL,
                 FOREIGN KEY (browser_profile_id) REFERENCES browser_profiles(browser_profile_id) ON DELETE SET NULL
             )
         """)
 
+        # Databases created before normalized_url existed get the column
+        # added; their rows are filled in by the next duplicate search
+        bookmark_columns = {row["name"] for row in cursor.execute("PRAGMA table_info(bookmarks)")}
+        if "normalized_url" not in bookmark_columns:
+            cursor.execute("ALTER TABLE bookmarks ADD COLUMN normalized_url TEXT")
+
         # Tags table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS tags (
@@ -140,6 +152,7 @@ class Database:
 
         # Create indexes for common queries
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks_url ON bookmarks(url)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks_normalized_url ON bookmarks(normalized_url)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks_folder ON bookmarks(folder_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks_profile ON bookmarks(browser_profile_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_folders_parent ON folders(parent_folder_id)")
@@ -172,8 +185,18 @@ class Database:
             END
         """)
 
+        # Only edits to the indexed columns need the FTS row replaced, not
+        # writes such as normalized_url or position. Databases created before
+        # this have a trigger that fires on every update; it is recreated
+        au_trigger = cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'bookmarks_au'"
+        ).fetchone()
+        if au_trigger is not None and "UPDATE OF" not in au_trigger["sql"]:
+            cursor.execute("DROP TRIGGER bookmarks_au")
+
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS bookmarks_au AFTER UPDATE ON bookmarks BEGIN
+            CREATE TRIGGER IF NOT EXISTS bookmarks_au
+            AFTER UPDATE OF title, url, description, notes ON bookmarks BEGIN
                 INSERT INTO bookmarks_fts(bookmarks_fts, rowid, title, url, description, notes)
                 VALUES ('delete', old.bookmark_id, old.title, old.url, old.description, old.notes);
                 INSERT INTO bookmarks_fts(rowid, title, url, description, notes)
@@ -328,10 +351,33 @@ class Database:
         return conn.executemany(query, params_list)
 
     def commit(self):
-        """Commit current transaction."""
-        if self.connection:
+        """Commit current transaction, unless inside a transaction() block."""
+        if self.connection and not self._transaction_depth:
             self.connection.commit()
 
+    @contextmanager
+    def transaction(self):
+        """Group all writes in the block into one transaction.
+
+        Model saves inside the block still call commit(), but those are
+        deferred so the whole block is written with a single commit. The
+        block is rolled back if it raises.
+        """
+        conn = self.connect()
+        if not self._transaction_depth and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if not self._transaction_depth:
+            conn.commit()
+
     def rollback(self):
         """Rollback current transaction."""
         if self.connection:
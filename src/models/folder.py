@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 import sqlite3
 
 
@@ -104,6 +104,23 @@ class Folder:
         row = cursor.fetchone()
         return cls.from_row(row) if row else None
 
+    @classmethod
+    def get_browser_id_map(cls, db, browser_profile_id: int) -> Dict[str, int]:
+        """Map each browser folder ID in a profile to its database folder ID."""
+        cursor = db.execute(
+            """
+            SELECT browser_folder_id, folder_id FROM folders
+            WHERE browser_profile_id = ?
+            ORDER BY folder_id
+            """,
+            (browser_profile_id,),
+        )
+        folder_ids: Dict[str, int] = {}
+        for browser_folder_id, folder_id in cursor:
+            # Like find_by_browser_id, the first match wins
+            folder_ids.setdefault(browser_folder_id, folder_id)
+        return folder_ids
+
     @classmethod
     def get_root_folders(cls, db) -> List["Folder"]:
         """Get all root-level folders (no parent)."""
@@ -134,6 +151,24 @@ class Folder:
         )
         return [cls.from_row(row) for row in cursor.fetchall()]
 
+    @classmethod
+    def get_all_by_profile(cls, db) -> Dict[int, List["Folder"]]:
+        """Get all folders grouped by browser profile ID, with one query.
+
+        Each profile's folders are in the same order as get_by_profile.
+        """
+        cursor = db.execute(
+            """
+            SELECT * FROM folders
+            ORDER BY browser_profile_id, browser_folder_path, position
+            """
+        )
+        folders: Dict[int, List["Folder"]] = {}
+        for row in cursor.fetchall():
+            folder = cls.from_row(row)
+            folders.setdefault(folder.browser_profile_id, []).append(folder)
+        return folders
+
     def get_full_path(self, db) -> str:
         """Get the full path of this folder including all parent names."""
         path_parts = [self.name]
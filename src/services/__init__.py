@@ -1,7 +1,7 @@
 """Services for browser sync, import, and export."""
 
-from .profile_detector import ProfileDetector
+from .profile_detector import ProfileDetector, get_profile_detector
 from .bookmark_parser import BookmarkParser
 from .import_service import ImportService
 
-__all__ = ["ProfileDetector", "BookmarkParser", "ImportService"]
+__all__ = ["ProfileDetector", "get_profile_detector", "BookmarkParser", "ImportService"]
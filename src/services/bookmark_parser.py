@@ -40,6 +40,18 @@ class ParsedBookmarksData:
     version: Optional[int] = None
 
 
+# Per-node members of Chromium bookmark files the parser never reads; they
+# are dropped while the JSON is decoded so the loaded tree stays smaller
+_UNUSED_KEYS = frozenset({
+    "guid", "meta_info", "date_last_used", "date_modified",
+    "sync_metadata", "sync_transaction_version",
+})
+
+
+def _drop_unused_keys(pairs: list) -> dict:
+    return {key: value for key, value in pairs if key not in _UNUSED_KEYS}
+
+
 class BookmarkParser:
     """Parses Chromium-based browser bookmark files."""
 
@@ -62,7 +74,7 @@ class BookmarkParser:
 
         try:
             with open(bookmarks_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                data = json.load(f, object_pairs_hook=_drop_unused_keys)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error reading bookmark file {bookmarks_path}: {e}")
             return result
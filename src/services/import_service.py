@@ -1,5 +1,6 @@
 """Service to import bookmarks from browsers into the database."""
 
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -9,7 +10,7 @@ from ..models.database import Database
 from ..models.browser_profile import BrowserProfile
 from ..models.folder import Folder
 from ..models.bookmark import Bookmark
-from .profile_detector import ProfileDetector, DetectedProfile
+from .profile_detector import DetectedProfile, get_profile_detector
 from .bookmark_parser import BookmarkParser, ParsedBookmarksData
 
 
@@ -31,6 +32,10 @@ class ImportProgress:
 ProgressCallback = Callable[[ImportProgress], None]
 
 
+class ImportCancelled(Exception):
+    """Raised inside import_profile when its cancel event is set."""
+
+
 @dataclass
 class ImportResult:
     """Result of an import operation."""
@@ -48,7 +53,7 @@ class ImportService:
 
     def __init__(self, db: Database):
         self.db = db
-        self.profile_detector = ProfileDetector()
+        self.profile_detector = get_profile_detector()
         self.bookmark_parser = BookmarkParser()
 
     def detect_profiles(self) -> List[DetectedProfile]:
@@ -63,6 +68,9 @@ class ImportService:
         self,
         detected_profile: DetectedProfile,
         progress_callback: Optional[ProgressCallback] = None,
+        batch_size: int = 500,
+        parse: Optional[Callable[[], ParsedBookmarksData]] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> ImportResult:
         """Import bookmarks from a detected browser profile.
 
@@ -73,9 +81,18 @@ class ImportService:
         Args:
             detected_profile: The profile to import from
             progress_callback: Optional callback for progress updates
+            batch_size: Number of new bookmarks queued before each Bookmark.insert_many call
+            parse: Optional callable returning the already parsed Bookmarks
+                file, e.g. from another thread; parsed here if not given
+            cancel_event: Optional event checked once per batch; when set,
+                ImportCancelled is raised so the caller's transaction can
+                roll the partial import back
 
         Returns:
             ImportResult with statistics about the import
+
+        Raises:
+            ImportCancelled: If cancel_event was set during the import
         """
         # Get or create the browser profile in the database
         db_profile = BrowserProfile.find_by_browser_and_profile(
@@ -105,7 +122,10 @@ class ImportService:
             return result
 
         try:
-            parsed_data = self.bookmark_parser.parse_file(bookmarks_path)
+            if parse is not None:
+                parsed_data = parse()
+            else:
+                parsed_data = self.bookmark_parser.parse_file(bookmarks_path)
         except Exception as e:
             result.errors.append(f"Error parsing bookmarks file: {e}")
             return result
@@ -124,7 +144,8 @@ class ImportService:
 
         # Import bookmarks
         self._import_bookmarks(
-            db_profile, parsed_data, folder_id_map, result, progress, progress_callback
+            db_profile, parsed_data, folder_id_map, result, progress, progress_callback,
+            batch_size, cancel_event
         )
 
         # Update last synced timestamp
@@ -156,6 +177,8 @@ class ImportService:
         """
         folder_id_map: Dict[str, int] = {}
         progress.phase = "folders"
+        # One query for the profile's existing folders instead of one per folder
+        existing_folders = Folder.get_browser_id_map(self.db, db_profile.browser_profile_id)
 
         # Sort folders by path depth so parents are created before children
         sorted_folders = sorted(
@@ -171,18 +194,16 @@ class ImportService:
                 progress_callback(progress)
 
             # Check if folder already exists
-            existing = Folder.find_by_browser_id(
-                self.db, db_profile.browser_profile_id, parsed_folder.browser_id
-            )
+            existing_id = existing_folders.get(parsed_folder.browser_id)
 
             # Determine parent_folder_id from our mapping
             parent_folder_id = None
             if parsed_folder.parent_folder_id:
                 parent_folder_id = folder_id_map.get(parsed_folder.parent_folder_id)
 
-            if existing:
+            if existing_id is not None:
                 # Folder already exists - just record its ID for bookmark mapping
-                folder_id_map[parsed_folder.browser_id] = existing.folder_id
+                folder_id_map[parsed_folder.browser_id] = existing_id
                 result.folders_skipped += 1
                 progress.skipped += 1
             else:
@@ -197,6 +218,7 @@ class ImportService:
                 )
                 folder.save(self.db)
                 folder_id_map[parsed_folder.browser_id] = folder.folder_id
+                existing_folders[parsed_folder.browser_id] = folder.folder_id
                 result.folders_added += 1
 
         return folder_id_map
@@ -209,10 +231,13 @@ class ImportService:
         result: ImportResult,
         progress: ImportProgress,
         progress_callback: Optional[ProgressCallback] = None,
+        batch_size: int = 500,
+        cancel_event: Optional[threading.Event] = None,
     ):
         """Import bookmarks from parsed data.
 
-        Only imports new bookmarks - skips existing ones.
+        Only imports new bookmarks - skips existing ones. New bookmarks are
+        inserted in batches of batch_size.
 
         Args:
             db_profile: The database browser profile
@@ -221,10 +246,22 @@ class ImportService:
             result: ImportResult to update with statistics
             progress: Progress tracker
             progress_callback: Optional callback for progress updates
+            batch_size: Number of new bookmarks queued before each Bookmark.insert_many call
+            cancel_event: Optional event checked every batch_size bookmarks
+
+        Raises:
+            ImportCancelled: If cancel_event is set
         """
         progress.phase = "bookmarks"
+        pending: List[Bookmark] = []
+        # One query for the profile's existing bookmarks instead of one per
+        # bookmark; queued bookmarks are added as they are accepted
+        existing_ids = Bookmark.get_browser_ids(self.db, db_profile.browser_profile_id)
+
+        for index, parsed_bookmark in enumerate(parsed_data.bookmarks):
+            if cancel_event is not None and index % batch_size == 0 and cancel_event.is_set():
+                raise ImportCancelled()
 
-        for parsed_bookmark in parsed_data.bookmarks:
             progress.current_item += 1
             progress.current_title = parsed_bookmark.title or "(no title)"
             progress.current_url = parsed_bookmark.url
@@ -233,11 +270,7 @@ class ImportService:
                 progress_callback(progress)
 
             # Check if bookmark already exists
-            existing = Bookmark.find_by_browser_id(
-                self.db, db_profile.browser_profile_id, parsed_bookmark.browser_id
-            )
-
-            if existing:
+            if parsed_bookmark.browser_id in existing_ids:
                 # Bookmark already exists - skip it
                 result.bookmarks_skipped += 1
                 progress.skipped += 1
@@ -257,9 +290,17 @@ class ImportService:
                     browser_added_at=parsed_bookmark.date_added,
                     position=parsed_bookmark.position,
                 )
-                bookmark.save(self.db)
+                pending.append(bookmark)
+                existing_ids.add(parsed_bookmark.browser_id)
                 result.bookmarks_added += 1
 
+                if len(pending) >= batch_size:
+                    Bookmark.insert_many(self.db, pending)
+                    pending.clear()
+
+        if pending:
+            Bookmark.insert_many(self.db, pending)
+
     def import_all_profiles(
         self,
         progress_callback: Optional[ProgressCallback] = None,
@@ -1,9 +1,11 @@
 """Service to detect browser profiles."""
 
 import json
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from ..utils.browser_paths import get_installed_browsers, is_chromium_based
 
@@ -20,6 +22,25 @@ class DetectedProfile:
     has_bookmarks_file: bool = False
 
 
+# Detected profiles by (browser, profile path), with the stamps of the
+# Bookmarks and Preferences files they were read from. Profiles whose files
+# are unchanged are reused instead of re-parsing both JSON files.
+_PROFILE_CACHE: Dict[Tuple[str, Path], Tuple[tuple, DetectedProfile]] = {}
+
+
+# A bookmark node's type member in a Chromium Bookmarks file
+_URL_NODE = re.compile(rb'"type"\s*:\s*"url"')
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 class ProfileDetector:
     """Detects browser profiles for Chromium-based browsers."""
 
@@ -75,24 +96,30 @@ class ProfileDetector:
         """
         profiles = []
 
-        if not user_data_path.exists():
+        # One directory scan finds Default and the numbered profiles
+        # (Profile 1, Profile 2, etc.); scandir entries answer is_dir()
+        # without another stat on most platforms
+        try:
+            with os.scandir(user_data_path) as entries:
+                profile_dirs = [
+                    entry.name for entry in entries
+                    if (entry.name == "Default" or entry.name.startswith("Profile "))
+                    and entry.is_dir()
+                ]
+        except OSError:
             return profiles
 
-        # Check for Default profile
-        default_profile = self._check_profile_directory(
-            browser_name, user_data_path / "Default", "Default"
-        )
-        if default_profile:
-            profiles.append(default_profile)
-
-        # Check for numbered profiles (Profile 1, Profile 2, etc.)
-        for item in user_data_path.iterdir():
-            if item.is_dir() and item.name.startswith("Profile "):
-                profile = self._check_profile_directory(
-                    browser_name, item, item.name
-                )
-                if profile:
-                    profiles.append(profile)
+        # Default profile comes first
+        if "Default" in profile_dirs:
+            profile_dirs.remove("Default")
+            profile_dirs.insert(0, "Default")
+
+        for name in profile_dirs:
+            profile = self._check_profile_directory(
+                browser_name, user_data_path / name, name
+            )
+            if profile:
+                profiles.append(profile)
 
         return profiles
 
@@ -113,7 +140,15 @@ class ProfileDetector:
             return None
 
         bookmarks_file = profile_path / "Bookmarks"
-        has_bookmarks = bookmarks_file.exists()
+        bookmarks_stamp = _file_stamp(bookmarks_file)
+        has_bookmarks = bookmarks_stamp is not None
+
+        # Reuse the last result while neither file has changed
+        cache_key = (browser_name, profile_path)
+        stamp = (bookmarks_stamp, _file_stamp(profile_path / "Preferences"))
+        cached = _PROFILE_CACHE.get(cache_key)
+        if cached and cached[0] == stamp:
+            return replace(cached[1])
 
         # Try to get the user-friendly profile name from Preferences
         profile_name = self._get_profile_name(profile_path)
@@ -123,7 +158,7 @@ class ProfileDetector:
         if has_bookmarks:
             bookmark_count = self._count_bookmarks(bookmarks_file)
 
-        return DetectedProfile(
+        profile = DetectedProfile(
             browser_name=browser_name,
             profile_id=profile_id,
             profile_name=profile_name,
@@ -131,6 +166,8 @@ class ProfileDetector:
             bookmark_count=bookmark_count,
             has_bookmarks_file=has_bookmarks,
         )
+        _PROFILE_CACHE[cache_key] = (stamp, profile)
+        return replace(profile)
 
     def _get_profile_name(self, profile_path: Path) -> Optional[str]:
         """Get the user-friendly profile name from Preferences file.
@@ -186,6 +223,10 @@ class ProfileDetector:
     def _count_bookmarks(self, bookmarks_file: Path) -> int:
         """Count the number of bookmarks in a bookmarks file.
 
+        Counts the "type": "url" members in the raw file instead of parsing
+        the whole JSON tree. Quotes inside titles and URLs are escaped, so
+        the pattern only matches bookmark nodes.
+
         Args:
             bookmarks_file: Path to the Bookmarks file
 
@@ -193,41 +234,11 @@ class ProfileDetector:
             Number of bookmarks (approximate)
         """
         try:
-            with open(bookmarks_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            count = 0
-            roots = data.get("roots", {})
-
-            for root_name, root_data in roots.items():
-                if isinstance(root_data, dict):
-                    count += self._count_bookmarks_recursive(root_data)
-
-            return count
-
-        except (json.JSONDecodeError, IOError):
+            with open(bookmarks_file, "rb") as f:
+                return len(_URL_NODE.findall(f.read()))
+        except IOError:
             return 0
 
-    def _count_bookmarks_recursive(self, node: dict) -> int:
-        """Recursively count bookmarks in a node.
-
-        Args:
-            node: Bookmark node dictionary
-
-        Returns:
-            Number of bookmarks in this node and children
-        """
-        count = 0
-
-        if node.get("type") == "url":
-            count = 1
-        elif node.get("type") == "folder":
-            children = node.get("children", [])
-            for child in children:
-                count += self._count_bookmarks_recursive(child)
-
-        return count
-
     def get_summary(self) -> Dict[str, any]:
         """Get a summary of detected browsers and profiles.
 
@@ -255,3 +266,19 @@ class ProfileDetector:
             })
 
         return summary
+
+
+# Global detector instance
+_profile_detector: Optional[ProfileDetector] = None
+
+
+def get_profile_detector() -> ProfileDetector:
+    """Get or create the global profile detector.
+
+    The installed browsers are looked up once per session instead of each
+    time an import dialog or service is created.
+    """
+    global _profile_detector
+    if _profile_detector is None:
+        _profile_detector = ProfileDetector()
+    return _profile_detector
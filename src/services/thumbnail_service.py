@@ -3,16 +3,17 @@
 import hashlib
 import json
 import os
+import queue
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple, List, Callable
 from datetime import datetime, timedelta
 
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QUrl
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage
 from PyQt6.QtWidgets import QApplication
 
 
@@ -29,6 +30,22 @@ def check_playwright_available() -> bool:
         return False
 
 
+def _capture_page(browser, url: str, cache_path: Path, width: int = 800, height: int = 600) -> Tuple[bool, str]:
+    """Screenshot a URL in a fresh page of an already running browser."""
+    page = browser.new_page(viewport={"width": width, "height": height})
+    try:
+        page.goto(url, timeout=30000, wait_until="networkidle")
+        page.wait_for_timeout(1000)
+
+        # Take screenshot directly to file
+        page.screenshot(path=str(cache_path), type="png")
+        return True, ""
+    except Exception as e:
+        return False, str(e)
+    finally:
+        page.close()
+
+
 def capture_screenshot_sync(url: str, cache_path: Path, width: int = 800, height: int = 600) -> Tuple[bool, str]:
     """Capture screenshot synchronously (for use in thread pool).
 
@@ -40,19 +57,10 @@ def capture_screenshot_sync(url: str, cache_path: Path, width: int = 800, height
 
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
-            page = browser.new_page(viewport={"width": width, "height": height})
-
             try:
-                page.goto(url, timeout=30000, wait_until="networkidle")
-                page.wait_for_timeout(1000)
-
-                # Take screenshot directly to file
-                page.screenshot(path=str(cache_path), type="png")
+                return _capture_page(browser, url, cache_path, width, height)
+            finally:
                 browser.close()
-                return True, ""
-            except Exception as e:
-                browser.close()
-                return False, str(e)
     except ImportError:
         return False, "Playwright not installed"
     except Exception as e:
@@ -192,6 +200,38 @@ class BatchThumbnailWorker(QThread):
                 pass
         return False
 
+    def _capture_queued(self, pending: "queue.Queue[str]", results: "queue.Queue[Tuple[str, bool, str]]"):
+        """Capture queued URLs with a single browser until the queue is empty."""
+        def fail_remaining(error: str):
+            while True:
+                try:
+                    url = pending.get_nowait()
+                except queue.Empty:
+                    return
+                results.put((url, False, error))
+
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError:
+            fail_remaining("Playwright not installed")
+            return
+
+        try:
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                try:
+                    while not self._cancelled:
+                        try:
+                            url = pending.get_nowait()
+                        except queue.Empty:
+                            break
+                        success, error = _capture_page(browser, url, self._get_cache_path(url))
+                        results.put((url, success, error))
+                finally:
+                    browser.close()
+        except Exception as e:
+            fail_remaining(str(e))
+
     def run(self):
         """Run batch thumbnail generation."""
         # Filter URLs if skipping cached
@@ -215,41 +255,38 @@ class BatchThumbnailWorker(QThread):
         # Note: Playwright has issues with concurrent instances, so we use max_workers=2
         effective_workers = min(self.max_workers, 2)  # Limit for Playwright stability
 
+        # Each pool thread launches one browser and reuses it for every URL
+        # it takes from the queue, instead of starting Chromium per URL
+        pending: "queue.Queue[str]" = queue.Queue()
+        for url in urls_to_process:
+            pending.put(url)
+        results: "queue.Queue[Tuple[str, bool, str]]" = queue.Queue()
+
         with ThreadPoolExecutor(max_workers=effective_workers) as executor:
-            # Submit all tasks
-            future_to_url = {}
-            for url in urls_to_process:
-                if self._cancelled:
-                    break
-                cache_path = self._get_cache_path(url)
-                future = executor.submit(capture_screenshot_sync, url, cache_path)
-                future_to_url[future] = url
-
-            # Process completed tasks
+            futures = [
+                executor.submit(self._capture_queued, pending, results)
+                for _ in range(min(effective_workers, len(urls_to_process)))
+            ]
+
+            # Process completed captures
             completed = 0
             total = len(urls_to_process)
 
-            for future in as_completed(future_to_url):
-                if self._cancelled:
-                    # Cancel remaining futures
-                    for f in future_to_url:
-                        f.cancel()
-                    break
+            while completed < total and not self._cancelled:
+                try:
+                    url, success, error = results.get(timeout=0.5)
+                except queue.Empty:
+                    if all(f.done() for f in futures) and results.empty():
+                        break
+                    continue
 
-                url = future_to_url[future]
                 completed += 1
-
-                try:
-                    success, error = future.result()
-                    if success:
-                        success_count += 1
-                        self.thumbnail_generated.emit(url, True, "")
-                    else:
-                        error_count += 1
-                        self.thumbnail_generated.emit(url, False, error)
-                except Exception as e:
+                if success:
+                    success_count += 1
+                    self.thumbnail_generated.emit(url, True, "")
+                else:
                     error_count += 1
-                    self.thumbnail_generated.emit(url, False, str(e))
+                    self.thumbnail_generated.emit(url, False, error)
 
                 self.progress.emit(completed, total, url)
 
@@ -268,6 +305,9 @@ class ThumbnailService(QObject):
     batch_thumbnail_generated = pyqtSignal(str, bool, str)  # url, success, error
     batch_finished = pyqtSignal(int, int)  # success_count, error_count
 
+    # QPixmapCache size limit in KB
+    _PIXMAP_CACHE_KB = 64 * 1024
+
     def __init__(self):
         super().__init__()
         # Cache directory
@@ -287,6 +327,12 @@ class ThumbnailService(QObject):
         # Cache duration (7 days)
         self.cache_duration = timedelta(days=7)
 
+        # Decoded thumbnails are kept in Qt's pixmap cache, so showing a
+        # thumbnail again doesn't re-read and decode its PNG. 64 MB holds
+        # about thirty 800x600 thumbnails; Qt evicts the oldest beyond that.
+        if QPixmapCache.cacheLimit() < self._PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(self._PIXMAP_CACHE_KB)
+
     def _load_metadata(self) -> dict:
         """Load cache metadata."""
         if self.metadata_file.exists():
@@ -310,6 +356,21 @@ class ThumbnailService(QObject):
         url_hash = hashlib.md5(url.encode()).hexdigest()
         return self.cache_dir / f"{url_hash}.png"
 
+    @staticmethod
+    def _pixmap_key(url: str) -> str:
+        """Get the QPixmapCache key of a URL's thumbnail."""
+        return f"thumbnail:{url}"
+
+    def _load_cached_pixmap(self, url: str, cache_path: Path) -> QPixmap:
+        """Load a cached thumbnail file, from QPixmapCache when decoded before."""
+        key = self._pixmap_key(url)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(str(cache_path))
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def _is_cache_valid(self, url: str) -> bool:
         """Check if cached thumbnail is still valid."""
         cache_path = self._get_cache_path(url)
@@ -348,8 +409,10 @@ class ThumbnailService(QObject):
         cache_path = self._get_cache_path(url)
 
         # Check cache first
-        if not force_refresh and self._is_cache_valid(url):
-            pixmap = QPixmap(str(cache_path))
+        if force_refresh:
+            QPixmapCache.remove(self._pixmap_key(url))
+        elif self._is_cache_valid(url):
+            pixmap = self._load_cached_pixmap(url, cache_path)
             if not pixmap.isNull():
                 return pixmap
 
@@ -370,7 +433,7 @@ class ThumbnailService(QObject):
         """
         if self._is_cache_valid(url):
             cache_path = self._get_cache_path(url)
-            pixmap = QPixmap(str(cache_path))
+            pixmap = self._load_cached_pixmap(url, cache_path)
             if not pixmap.isNull():
                 return pixmap
         return None
@@ -394,6 +457,7 @@ class ThumbnailService(QObject):
             'timestamp': datetime.now().isoformat()
         }
         self._save_metadata()
+        QPixmapCache.insert(self._pixmap_key(url), pixmap)
 
         # Emit signal
         self.thumbnail_ready.emit(url, pixmap)
@@ -461,6 +525,8 @@ class ThumbnailService(QObject):
                 'url': url,
                 'timestamp': datetime.now().isoformat()
             }
+            # The file was rewritten; decode it again on next use
+            QPixmapCache.remove(self._pixmap_key(url))
         self.batch_thumbnail_generated.emit(url, success, error)
 
     def _on_batch_finished(self, success_count: int, error_count: int):
@@ -470,6 +536,9 @@ class ThumbnailService(QObject):
 
     def clear_cache(self):
         """Clear all cached thumbnails."""
+        for entry in self.metadata.values():
+            if isinstance(entry, dict) and 'url' in entry:
+                QPixmapCache.remove(self._pixmap_key(entry['url']))
         for file in self.cache_dir.glob("*.png"):
             try:
                 file.unlink()
@@ -152,9 +152,7 @@ class DeadLinkWorker(QThread):
             url_to_bookmarks = {}
             for bookmark in http_bookmarks:
                 normalized = normalize_url(bookmark.url)
-                if normalized not in url_to_bookmarks:
-                    url_to_bookmarks[normalized] = []
-                url_to_bookmarks[normalized].append(bookmark)
+                url_to_bookmarks.setdefault(normalized, []).append(bookmark)
 
             unique_urls = len(url_to_bookmarks)
 
@@ -245,6 +243,9 @@ class DeadLinkWorker(QThread):
 class DeadLinkDialog(QDialog):
     """Dialog for checking dead links with progress display."""
 
+    # Signal to notify parent that a check ran and wrote dead link results
+    data_changed = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = get_database()
@@ -406,6 +407,8 @@ class DeadLinkDialog(QDialog):
         self.worker.finished_checking.connect(self.on_finished)
         self.worker.error_occurred.connect(self.on_error)
         self.worker.start()
+        # Results are saved as they are found, even if the check is cancelled
+        self.data_changed.emit()
 
     def cancel_check(self):
         """Cancel the current check."""
@@ -446,12 +449,14 @@ class DeadLinkDialog(QDialog):
             status_text = str(result.status_code) if result.status_code else "N/A"
             self.results_table.setItem(row, 2, QTableWidgetItem(status_text))
 
-            error_text = result.error_message or ""
-            self.results_table.setItem(row, 3, QTableWidgetItem(error_text))
+            # Cells without an item show empty, so none is created for
+            # a missing error or a single copy
+            if result.error_message:
+                self.results_table.setItem(row, 3, QTableWidgetItem(result.error_message))
 
             # Show duplicate count (only if > 1)
-            copies_text = str(result.duplicate_count) if result.duplicate_count > 1 else ""
-            self.results_table.setItem(row, 4, QTableWidgetItem(copies_text))
+            if result.duplicate_count > 1:
+                self.results_table.setItem(row, 4, QTableWidgetItem(str(result.duplicate_count)))
 
     def on_finished(self, dead_links: list, unique_checked: int, total_bookmarks: int, check_run_id: str):
         """Handle check completion."""
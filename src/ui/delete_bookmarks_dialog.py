@@ -1,19 +1,28 @@
 """Dialog for selecting and deleting bookmarks from browsers."""
 
+import sqlite3
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QSortFilterProxyModel
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QThread, QSortFilterProxyModel, QAbstractTableModel, QModelIndex
+)
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QTreeWidget, QTreeWidgetItem, QLabel, QPushButton, QGroupBox,
     QMessageBox, QProgressDialog, QCheckBox, QHeaderView, QFrame,
     QSplitter, QTextEdit, QComboBox, QRadioButton, QButtonGroup, QMenu,
     QLineEdit, QToolButton, QWidgetAction, QListWidget, QListWidgetItem,
-    QAbstractItemView, QApplication, QScrollArea, QSizePolicy, QTableWidget,
-    QTableWidgetItem
+    QAbstractItemView, QApplication, QScrollArea, QSizePolicy, QTableView
 )
 from PyQt6.QtGui import QColor, QBrush, QFont, QAction
 from PyQt6.QtCore import QTimer
@@ -25,6 +34,10 @@ from ..services.browser_process import BrowserProcessService
 from ..services.import_service import ImportService
 
 
+# ASCII-only lowercase table; hostnames are ASCII (IDNs use Punycode)
+_ASCII_LOWER = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+
+
 def parse_url_components(url: str) -> Tuple[str, str, str]:
     """Parse a URL into its domain components.
 
@@ -39,7 +52,11 @@ def parse_url_components(url: str) -> Tuple[str, str, str]:
     """
     try:
         parsed = urlparse(url)
-        hostname = parsed.netloc.lower()
+        netloc = parsed.netloc
+        try:
+            hostname = netloc.encode('ascii').translate(_ASCII_LOWER).decode('ascii')
+        except UnicodeEncodeError:
+            hostname = netloc.lower()
 
         # Remove port if present
         if ':' in hostname:
@@ -84,6 +101,33 @@ def parse_url_components(url: str) -> Tuple[str, str, str]:
         return ("", "", "")
 
 
+# Short descriptions for common HTTP error status codes
+_HTTP_DESC = MappingProxyType({
+    400: "400 Bad Request", 401: "401 Unauthorized", 403: "403 Forbidden",
+    404: "404 Not Found", 405: "405 Method Not Allowed", 408: "408 Timeout",
+    410: "410 Gone", 429: "429 Too Many Requests", 500: "500 Server Error",
+    502: "502 Bad Gateway", 503: "503 Unavailable", 504: "504 Gateway Timeout",
+})
+
+
+@lru_cache(maxsize=4096)
+def _classify_error(error_message: str) -> str:
+    """Map a raw connection error message to a short label.
+
+    Cached because the same error text repeats for many dead links.
+    """
+    msg = error_message.lower()
+    if "timeout" in msg:
+        return "Connection Timeout"
+    elif "connection refused" in msg:
+        return "Connection Refused"
+    elif "dns" in msg or "getaddrinfo" in msg:
+        return "DNS Lookup Failed"
+    elif "ssl" in msg or "certificate" in msg:
+        return "SSL Error"
+    return error_message[:30]
+
+
 class FilterListWidget(QWidget):
     """A compact filter widget with a searchable checkbox list."""
 
@@ -94,6 +138,9 @@ class FilterListWidget(QWidget):
         self.title = title
         self.all_values: List[str] = []
         self.checkboxes: Dict[str, QCheckBox] = {}
+        # Lowercased values in sorted order with their checkboxes, for prefix search
+        self._lower_values: List[str] = []
+        self._lower_checkboxes: List[QCheckBox] = []
 
         self.setup_ui()
 
@@ -150,8 +197,14 @@ class FilterListWidget(QWidget):
         self.status_label.setStyleSheet("color: #666; font-size: 10px;")
         layout.addWidget(self.status_label)
 
-    def set_values(self, values: List[str]):
-        """Set available values."""
+    def set_values(self, values: Iterable[str], pre_sorted: bool = False):
+        """Set available values.
+
+        Args:
+            values: Values to show as checkboxes
+            pre_sorted: If True, values are already unique and sorted, so the
+                        dedup/sort pass is skipped
+        """
         # Remember checked values
         checked = {v for v, cb in self.checkboxes.items() if cb.isChecked()}
 
@@ -166,13 +219,20 @@ class FilterListWidget(QWidget):
             if item.widget():
                 item.widget().deleteLater()
 
-        self.all_values = sorted(set(v for v in values if v))
+        if pre_sorted:
+            self.all_values = [v for v in values if v]
+        else:
+            self.all_values = sorted(set(v for v in values if v))
 
-        # Create checkboxes
+        # Create checkboxes - restore state before connecting so no
+        # per-checkbox filterChanged is emitted during the rebuild
+        restored = set()
         for value in self.all_values:
             cb = QCheckBox(value[:40] + "..." if len(value) > 40 else value)
             cb.setToolTip(value)
-            cb.setChecked(value in checked)
+            if value in checked:
+                cb.setChecked(True)
+                restored.add(value)
             cb.stateChanged.connect(self._on_changed)
             self.checkboxes[value] = cb
             self.list_layout.addWidget(cb)
@@ -180,11 +240,40 @@ class FilterListWidget(QWidget):
         self.list_layout.addStretch()
         self._update_status()
 
+        lowered = sorted(((v.lower(), self.checkboxes[v]) for v in self.all_values),
+                         key=lambda pair: pair[0])
+        self._lower_values = [lv for lv, _ in lowered]
+        self._lower_checkboxes = [cb for _, cb in lowered]
+
+        # Previously checked values may have disappeared - notify once
+        if restored != checked:
+            self.filterChanged.emit()
+
     def _filter_list(self, text: str):
-        """Filter visible checkboxes."""
+        """Filter visible checkboxes.
+
+        Matches values starting with the text via binary search on the
+        sorted lowercase values, falling back to a substring match when
+        no value has that prefix.
+        """
         text = text.lower()
-        for value, cb in self.checkboxes.items():
-            cb.setVisible(text in value.lower() if text else True)
+        if not text:
+            for cb in self.checkboxes.values():
+                cb.setVisible(True)
+            return
+
+        lo = bisect_left(self._lower_values, text)
+        hi = bisect_left(self._lower_values, text + '\uffff')
+        if lo < hi:
+            matches = set(self._lower_checkboxes[lo:hi])
+        else:
+            matches = {
+                cb for lv, cb in zip(self._lower_values, self._lower_checkboxes)
+                if text in lv
+            }
+
+        for cb in self._lower_checkboxes:
+            cb.setVisible(cb in matches)
 
     def _on_changed(self, state):
         """Handle checkbox change."""
@@ -200,9 +289,9 @@ class FilterListWidget(QWidget):
         else:
             self.status_label.setText(f"{checked} of {total} selected")
 
-    def get_selected(self) -> Optional[Set[str]]:
+    def get_selected(self) -> Optional[FrozenSet[str]]:
         """Get selected values, or None if no filter."""
-        selected = {v for v, cb in self.checkboxes.items() if cb.isChecked()}
+        selected = frozenset(v for v, cb in self.checkboxes.items() if cb.isChecked())
         return selected if selected else None
 
     def select_all(self):
@@ -226,9 +315,18 @@ class FilterListWidget(QWidget):
         self.filterChanged.emit()
 
 
-@dataclass
+# Category bits for DeletionItem.cat_mask
+CAT_DEAD_LINK = 1
+CAT_EXACT_DUPLICATE = 2
+CAT_SIMILAR_DUPLICATE = 4
+
+
+@dataclass(slots=True)
 class DeletionItem:
-    """An item that can be selected for deletion."""
+    """An item that can be selected for deletion.
+
+    Slotted, since a full load holds one instance per candidate bookmark.
+    """
     bookmark_id: int
     browser_bookmark_id: str
     browser_name: str
@@ -244,16 +342,296 @@ class DeletionItem:
     url_subdomain: str = ""
     url_domain: str = ""
     url_tld: str = ""
+    # "Browser/Profile" display string, built once instead of per table row
+    profile_key: str = field(default="", init=False)
+    # Category bits and duplicate type derived from reason, so filters and
+    # rows don't have to substring-search it
+    cat_mask: int = field(default=0, init=False)
+    dup_type: Optional[str] = field(default=None, init=False)
+    # Truncated titles for the table and the preview tree
+    display_title: str = field(default="", init=False)
+    short_title: str = field(default="", init=False)
 
     def __post_init__(self):
         """Parse URL components after initialization."""
         if self.url and not self.url_domain:
             self.url_subdomain, self.url_domain, self.url_tld = parse_url_components(self.url)
 
+        # Intern the highly repetitive filter fields so equal values share one
+        # object and set/dict lookups on them hit the identity fast path
+        self.browser_name = sys.intern(self.browser_name)
+        if self.profile_name:
+            self.profile_name = sys.intern(self.profile_name)
+        self.url_subdomain = sys.intern(self.url_subdomain)
+        self.url_domain = sys.intern(self.url_domain)
+        self.url_tld = sys.intern(self.url_tld)
+        if self.folder_path:
+            self.folder_path = sys.intern(self.folder_path)
+        if self.dead_link_detail:
+            self.dead_link_detail = sys.intern(self.dead_link_detail)
+        self.profile_key = sys.intern(f"{self.browser_name}/{self.profile_name}")
+        title = self.title
+        self.display_title = title[:60]
+        self.short_title = title[:35] + "..." if len(title) > 35 else title
+        self._update_category()
+
+    def add_reason(self, reason: str):
+        """Add another reason this item is a deletion candidate."""
+        self.reason += f",{reason}"
+        self._update_category()
+
+    def _update_category(self):
+        """Recompute cat_mask and dup_type from reason."""
+        reason = self.reason
+        self.cat_mask = (
+            (CAT_DEAD_LINK if "dead_link" in reason else 0)
+            | (CAT_EXACT_DUPLICATE if "exact_duplicate" in reason else 0)
+            | (CAT_SIMILAR_DUPLICATE if "similar_duplicate" in reason else 0)
+        )
+        if self.cat_mask & CAT_EXACT_DUPLICATE:
+            self.dup_type = "Exact"
+        elif self.cat_mask & CAT_SIMILAR_DUPLICATE:
+            self.dup_type = "Similar"
+        else:
+            self.dup_type = None
+
+    @property
+    def is_dead(self) -> bool:
+        """Whether this item is a dead link."""
+        return bool(self.cat_mask & CAT_DEAD_LINK)
+
+
+class DeletionItemsModel(QAbstractTableModel):
+    """Table model over the filtered deletion items.
+
+    Cell values are produced on demand in data(), so only the rows the view
+    actually paints are materialized. Checked state lives in the dialog's
+    selected_for_deletion set, which the model shares.
+    """
+
+    checkToggled = pyqtSignal()
+
+    HEADERS = ["✓", "Title", "URL", "Folder", "Browser/Profile", "Dead Link", "Duplicate"]
+
+    # Shared brushes for cells, created once rather than per row
+    _RED_BRUSH = QBrush(QColor(220, 53, 69))
+    _ORANGE_BRUSH = QBrush(QColor(255, 153, 0))
+    _KEEP_BG_BRUSH = QBrush(QColor(200, 255, 200))
+
+    def __init__(self, selected: Set[int], keep_in_group: Dict[int, int], parent=None):
+        super().__init__(parent)
+        self._items: List[DeletionItem] = []
+        # Items as loaded, restored when the view asks for no sort column
+        self._loaded_items: List[DeletionItem] = []
+        self._selected = selected
+        self._keep_in_group = keep_in_group
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_items(self, items: List[DeletionItem]):
+        """Replace the displayed items, keeping the current sort order."""
+        self.beginResetModel()
+        self._loaded_items = items
+        self._items = list(items)
+        if self._sort_column is not None:
+            self._sort_items()
+        self.endResetModel()
+
+    def item_at(self, row: int) -> Optional[DeletionItem]:
+        """Get the item shown at a row."""
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def is_kept(self, item: DeletionItem) -> bool:
+        """Whether the item is the one kept in its duplicate group."""
+        return item.group_id is not None and self._keep_in_group.get(item.group_id) == item.bookmark_id
+
+    def checkable_ids(self) -> Iterable[int]:
+        """Bookmark IDs of all rows that can be checked (i.e. not kept)."""
+        is_kept = self.is_kept
+        return (item.bookmark_id for item in self._items if not is_kept(item))
+
+    def refresh_checks(self):
+        """Notify the view that check states changed outside setData."""
+        if self._items:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._items) - 1, 0),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 0 and not self.is_kept(self._items[index.row()]):
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(item, col)
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if col == 0 and not self.is_kept(item):
+                if item.bookmark_id in self._selected:
+                    return Qt.CheckState.Checked
+                return Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if col == 1:
+                return item.title
+            elif col == 2:
+                return item.url
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if col == 5 and item.dead_link_detail:
+                if "404" in item.dead_link_detail:
+                    return self._RED_BRUSH
+                elif "Timeout" in item.dead_link_detail:
+                    return self._ORANGE_BRUSH
+            elif col == 6 and not self.is_kept(item):
+                if item.dup_type == "Exact":
+                    return self._RED_BRUSH
+                elif item.dup_type == "Similar":
+                    return self._ORANGE_BRUSH
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if col == 6 and self.is_kept(item):
+                return self._KEEP_BG_BRUSH
+        elif role == Qt.ItemDataRole.UserRole:
+            return item.bookmark_id
+        return None
+
+    def _display_text(self, item: DeletionItem, col: int) -> Optional[str]:
+        """Get the text shown in a cell."""
+        if col == 1:
+            return item.display_title
+        elif col == 2:
+            return item.url
+        elif col == 3:
+            return item.folder_path or ""
+        elif col == 4:
+            return item.profile_key
+        elif col == 5:
+            return item.dead_link_detail or ""
+        elif col == 6:
+            if self.is_kept(item):
+                return "✓ KEEP"
+            return item.dup_type or ""
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return False
+        item = self._items[index.row()]
+        if self.is_kept(item):
+            return False
+
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._selected.add(item.bookmark_id)
+        else:
+            self._selected.discard(item.bookmark_id)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checkToggled.emit()
+        return True
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        if column < 0:
+            # No sort column - back to load order
+            self._sort_column = None
+        else:
+            self._sort_column = column
+            self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        # Remember which item each persistent index (e.g. the view's row
+        # selection) points at so it can follow the item to its new row
+        persistent = self.persistentIndexList()
+        tracked = [(self._items[index.row()], index.column()) for index in persistent]
+        if self._sort_column is None:
+            self._items = list(self._loaded_items)
+        else:
+            self._sort_items()
+        if persistent:
+            rows = {id(item): row for row, item in enumerate(self._items)}
+            self.changePersistentIndexList(
+                persistent, [self.index(rows[id(item)], col) for item, col in tracked]
+            )
+        self.layoutChanged.emit()
+
+    def _sort_items(self):
+        """Sort items in place by the current sort column."""
+        column = self._sort_column
+        if column == 0:
+            def key(item):
+                return item.bookmark_id in self._selected
+        else:
+            def key(item):
+                return self._display_text(item, column)
+        self._items.sort(key=key, reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+
 
 class DeleteBookmarksDialog(QDialog):
     """Dialog for selecting bookmarks to delete from browsers."""
 
+    _FILTER_NAMES = (
+        'browser', 'profile', 'domain', 'tld', 'subdomain',
+        'dead_link', 'duplicate', 'folder',
+    )
+    _FILTER_RESULTS_MAX = 32
+    _PREVIEW_ITEMS_PER_PROFILE = 15
+
+    # Queries are class constants so the same statement text is reused
+    # across loads and hits sqlite3's prepared statement cache
+    _SQL_LOAD_BOOKMARKS = """
+        SELECT
+            b.bookmark_id,
+            b.url,
+            COALESCE(NULLIF(b.title, ''), '(no title)') AS title,
+            b.browser_bookmark_id,
+            bp.browser_name,
+            bp.profile_display_name AS profile_name,
+            bp.profile_path,
+            COALESCE(NULLIF(f.browser_folder_path, ''), 'Bookmarks Bar') AS folder_path
+        FROM bookmarks b
+        JOIN browser_profiles bp ON b.browser_profile_id = bp.browser_profile_id
+        LEFT JOIN folders f ON b.folder_id = f.folder_id
+    """
+    _SQL_LATEST_DEAD_LINK_RUN = """
+        SELECT DISTINCT check_run_id FROM dead_links
+        ORDER BY checked_at DESC LIMIT 1
+    """
+    _SQL_LOAD_DEAD_LINKS = """
+        SELECT bookmark_id, status_code, error_message
+        FROM dead_links
+        WHERE check_run_id = ?
+    """
+    _SQL_LATEST_DUPLICATE_RUN = """
+        SELECT DISTINCT check_run_id FROM duplicate_groups
+        WHERE match_type = ?
+        ORDER BY created_at DESC LIMIT 1
+    """
+    _SQL_LOAD_DUPLICATE_GROUPS = """
+        SELECT duplicate_group_id, normalized_url
+        FROM duplicate_groups
+        WHERE check_run_id = ? AND match_type = ?
+    """
+    _SQL_LOAD_GROUP_MEMBERS = """
+        SELECT bookmark_id FROM duplicate_group_members
+        WHERE duplicate_group_id = ?
+    """
+    _SQL_DELETE_BOOKMARK = "DELETE FROM bookmarks WHERE bookmark_id = ?"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = get_database()
@@ -262,17 +640,42 @@ class DeleteBookmarksDialog(QDialog):
         # All items that could be deleted, keyed by bookmark_id
         self.all_items: Dict[int, DeletionItem] = {}
 
-        # Selected for deletion (bookmark_id -> True)
+        # Selected for deletion. Only ids of loaded items are ever added and
+        # the set is cleared on reload, so every id is a key of all_items.
         self.selected_for_deletion: Set[int] = set()
 
         # For duplicates: which bookmark to KEEP in each group (group_id -> bookmark_id)
         self.keep_in_group: Dict[int, int] = {}
 
-        # Filter widgets
+        # Filter widgets, and their cached selections; changed filters are
+        # marked dirty and re-read once by the next (debounced) rebuild
         self.filter_widgets: Dict[str, FilterListWidget] = {}
+        self._filter_cache: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._dirty_filters: Set[str] = set()
+
+        # Filter state signature -> matching items, reset on reload
+        self._filter_results: Dict[tuple, Tuple[DeletionItem, ...]] = {}
+
+        # filter name -> value -> bookmark_ids with that value, so filtering
+        # is done with set operations instead of testing every item
+        self._filter_index: Dict[str, Dict[str, Set[int]]] = {}
+        self._category_index: Dict[int, Set[int]] = {}
 
         # Track visible items
         self.visible_items: Set[int] = set()
+        self._highlighted_rows = 0
+
+        # Coalesce bursts of filter changes into a single table rebuild
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(50)
+        self._filter_timer.timeout.connect(self._do_apply_filters)
+
+        # Preview rebuilds run once per event-loop pass
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._do_update_preview)
 
         self.setWindowTitle("Delete Bookmarks from Browsers")
         self.setMinimumSize(1500, 900)
@@ -342,12 +745,10 @@ class DeleteBookmarksDialog(QDialog):
 
         # Browser filter
         self.browser_filter = FilterListWidget("Browser")
-        self.browser_filter.filterChanged.connect(self.apply_filters)
         cat_layout.addWidget(self.browser_filter)
 
         # Profile filter
         self.profile_filter = FilterListWidget("Profile")
-        self.profile_filter.filterChanged.connect(self.apply_filters)
         cat_layout.addWidget(self.profile_filter)
 
         cat_layout.addStretch()
@@ -360,17 +761,14 @@ class DeleteBookmarksDialog(QDialog):
 
         # Domain filter
         self.domain_filter = FilterListWidget("Domain")
-        self.domain_filter.filterChanged.connect(self.apply_filters)
         url_layout.addWidget(self.domain_filter)
 
         # TLD filter
         self.tld_filter = FilterListWidget("TLD")
-        self.tld_filter.filterChanged.connect(self.apply_filters)
         url_layout.addWidget(self.tld_filter)
 
         # Subdomain filter
         self.subdomain_filter = FilterListWidget("Subdomain")
-        self.subdomain_filter.filterChanged.connect(self.apply_filters)
         url_layout.addWidget(self.subdomain_filter)
 
         url_layout.addStretch()
@@ -383,17 +781,14 @@ class DeleteBookmarksDialog(QDialog):
 
         # Dead link error filter
         self.dead_link_filter = FilterListWidget("Dead Link Error")
-        self.dead_link_filter.filterChanged.connect(self.apply_filters)
         status_layout.addWidget(self.dead_link_filter)
 
         # Duplicate type filter
         self.duplicate_filter = FilterListWidget("Duplicate Type")
-        self.duplicate_filter.filterChanged.connect(self.apply_filters)
         status_layout.addWidget(self.duplicate_filter)
 
         # Folder filter
         self.folder_filter = FilterListWidget("Folder")
-        self.folder_filter.filterChanged.connect(self.apply_filters)
         status_layout.addWidget(self.folder_filter)
 
         status_layout.addStretch()
@@ -401,6 +796,19 @@ class DeleteBookmarksDialog(QDialog):
 
         filter_layout.addWidget(filter_tabs)
 
+        self.filter_widgets = {
+            'browser': self.browser_filter,
+            'profile': self.profile_filter,
+            'domain': self.domain_filter,
+            'tld': self.tld_filter,
+            'subdomain': self.subdomain_filter,
+            'dead_link': self.dead_link_filter,
+            'duplicate': self.duplicate_filter,
+            'folder': self.folder_filter,
+        }
+        for name, widget in self.filter_widgets.items():
+            widget.filterChanged.connect(lambda name=name: self._on_filter_changed(name))
+
         # Quick Actions
         actions_group = QGroupBox("Quick Actions")
         actions_layout = QVBoxLayout(actions_group)
@@ -437,19 +845,19 @@ class DeleteBookmarksDialog(QDialog):
         middle_layout = QVBoxLayout(middle_panel)
         middle_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Table widget - better checkbox handling than QTreeWidget
-        self.items_table = QTableWidget()
-        self.items_table.setColumnCount(7)
-        self.items_table.setHorizontalHeaderLabels([
-            "✓", "Title", "URL", "Folder", "Browser/Profile", "Dead Link", "Duplicate"
-        ])
-        self.items_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        # Table view backed by a model - cells are only built when painted
+        self.items_model = DeletionItemsModel(self.selected_for_deletion, self.keep_in_group, self)
+        self.items_model.checkToggled.connect(self.update_preview)
+        self.items_table = QTableView()
+        self.items_table.setModel(self.items_model)
+        self.items_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.items_table.setAlternatingRowColors(True)
+        self.items_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.items_table.setSortingEnabled(True)
         self.items_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.items_table.customContextMenuRequested.connect(self.show_context_menu)
-        self.items_table.cellChanged.connect(self.on_cell_changed)
-        self.items_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.items_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.items_model.modelReset.connect(self._on_items_reset)
 
         # Column sizes
         header = self.items_table.horizontalHeader()
@@ -586,62 +994,34 @@ class DeleteBookmarksDialog(QDialog):
         self._load_duplicates(bookmark_data, "exact")
         self._load_duplicates(bookmark_data, "similar")
 
-        # Build filter values
+        # Build filter values and the lookup used to apply them
         self._populate_filters()
+        self._build_filter_index()
 
         # Apply filters and show items
-        self.apply_filters()
+        self._do_apply_filters()
 
-    def _load_bookmark_data(self) -> Dict[int, dict]:
-        """Load bookmark data with profile and folder information."""
-        data = {}
-        cursor = self.db.execute("""
-            SELECT
-                b.bookmark_id,
-                b.url,
-                b.title,
-                b.browser_bookmark_id,
-                bp.browser_name,
-                bp.profile_display_name,
-                bp.profile_path,
-                f.browser_folder_path
-            FROM bookmarks b
-            JOIN browser_profiles bp ON b.browser_profile_id = bp.browser_profile_id
-            LEFT JOIN folders f ON b.folder_id = f.folder_id
-        """)
-
-        for row in cursor.fetchall():
-            data[row[0]] = {
-                'bookmark_id': row[0],
-                'url': row[1],
-                'title': row[2] or "(no title)",
-                'browser_bookmark_id': row[3],
-                'browser_name': row[4],
-                'profile_name': row[5],
-                'profile_path': row[6],
-                'folder_path': row[7] or "Bookmarks Bar"
-            }
-        return data
+    def _load_bookmark_data(self) -> Dict[int, sqlite3.Row]:
+        """Load bookmark data with profile and folder information.
 
-    def _load_dead_links(self, bookmark_data: Dict[int, dict]):
+        Rows are returned as sqlite3.Row objects keyed by bookmark_id, so
+        columns can be read by name without building a dict per bookmark.
+        """
+        cursor = self.db.execute(self._SQL_LOAD_BOOKMARKS)
+        return {row['bookmark_id']: row for row in cursor}
+
+    def _load_dead_links(self, bookmark_data: Dict[int, sqlite3.Row]):
         """Load dead links from the database."""
-        cursor = self.db.execute("""
-            SELECT DISTINCT check_run_id FROM dead_links
-            ORDER BY checked_at DESC LIMIT 1
-        """)
+        cursor = self.db.execute(self._SQL_LATEST_DEAD_LINK_RUN)
         row = cursor.fetchone()
         if not row:
             return
 
         check_run_id = row[0]
 
-        cursor = self.db.execute("""
-            SELECT bookmark_id, status_code, error_message
-            FROM dead_links
-            WHERE check_run_id = ?
-        """, (check_run_id,))
+        cursor = self.db.execute(self._SQL_LOAD_DEAD_LINKS, (check_run_id,))
 
-        for row in cursor.fetchall():
+        for row in cursor:
             bookmark_id = row[0]
             status_code = row[1]
             error_message = row[2]
@@ -665,43 +1045,37 @@ class DeleteBookmarksDialog(QDialog):
                 dead_link_detail=dead_link_detail
             )
 
-    def _load_duplicates(self, bookmark_data: Dict[int, dict], match_type: str):
+    def _load_duplicates(self, bookmark_data: Dict[int, sqlite3.Row], match_type: str):
         """Load duplicate groups from the database."""
-        cursor = self.db.execute("""
-            SELECT DISTINCT check_run_id FROM duplicate_groups
-            WHERE match_type = ?
-            ORDER BY created_at DESC LIMIT 1
-        """, (match_type,))
+        cursor = self.db.execute(self._SQL_LATEST_DUPLICATE_RUN, (match_type,))
         row = cursor.fetchone()
         if not row:
             return
 
         check_run_id = row[0]
 
-        cursor = self.db.execute("""
-            SELECT duplicate_group_id, normalized_url
-            FROM duplicate_groups
-            WHERE check_run_id = ? AND match_type = ?
-        """, (check_run_id, match_type))
+        cursor = self.db.execute(self._SQL_LOAD_DUPLICATE_GROUPS, (check_run_id, match_type))
 
         for group_id, normalized_url in cursor.fetchall():
-            cursor2 = self.db.execute("""
-                SELECT bookmark_id FROM duplicate_group_members
-                WHERE duplicate_group_id = ?
-            """, (group_id,))
+            cursor2 = self.db.execute(self._SQL_LOAD_GROUP_MEMBERS, (group_id,))
 
-            bookmark_ids = [r[0] for r in cursor2.fetchall()]
+            bookmark_ids = [r[0] for r in cursor2]
             valid_ids = [bid for bid in bookmark_ids if bid in bookmark_data]
 
             if len(valid_ids) < 2:
                 continue
 
+            # Choose which to keep while visiting members - prefer the
+            # first one that is not a dead link
+            keep_id = None
             for bookmark_id in valid_ids:
-                if bookmark_id in self.all_items:
-                    existing = self.all_items[bookmark_id]
+                existing = self.all_items.get(bookmark_id)
+                if existing is not None:
                     if match_type not in existing.reason:
-                        existing.reason += f",{match_type}_duplicate"
+                        existing.add_reason(f"{match_type}_duplicate")
                     existing.group_id = group_id
+                    if keep_id is None and not existing.is_dead:
+                        keep_id = bookmark_id
                     continue
 
                 bd = bookmark_data[bookmark_id]
@@ -717,14 +1091,8 @@ class DeleteBookmarksDialog(QDialog):
                     group_id=group_id,
                     folder_path=bd['folder_path']
                 )
-
-            # Choose which to keep - prefer non-dead-links
-            keep_id = None
-            for bookmark_id in valid_ids:
-                item = self.all_items.get(bookmark_id)
-                if item and "dead_link" not in item.reason:
+                if keep_id is None:
                     keep_id = bookmark_id
-                    break
 
             if keep_id is not None:
                 self.keep_in_group[group_id] = keep_id
@@ -732,71 +1100,81 @@ class DeleteBookmarksDialog(QDialog):
     def _format_dead_link_detail(self, status_code: Optional[int], error_message: Optional[str]) -> str:
         """Format dead link details."""
         if status_code:
-            descriptions = {
-                400: "400 Bad Request", 401: "401 Unauthorized", 403: "403 Forbidden",
-                404: "404 Not Found", 405: "405 Method Not Allowed", 408: "408 Timeout",
-                410: "410 Gone", 429: "429 Too Many Requests", 500: "500 Server Error",
-                502: "502 Bad Gateway", 503: "503 Unavailable", 504: "504 Gateway Timeout",
-            }
-            return descriptions.get(status_code, f"HTTP {status_code}")
+            return _HTTP_DESC.get(status_code, f"HTTP {status_code}")
 
         if error_message:
-            msg = error_message.lower()
-            if "timeout" in msg:
-                return "Connection Timeout"
-            elif "connection refused" in msg:
-                return "Connection Refused"
-            elif "dns" in msg or "getaddrinfo" in msg:
-                return "DNS Lookup Failed"
-            elif "ssl" in msg or "certificate" in msg:
-                return "SSL Error"
-            return error_message[:30]
+            return _classify_error(error_message)
 
         return "Unknown Error"
 
     def _populate_filters(self):
         """Populate filter widgets with values from data."""
-        browsers = set()
-        profiles = set()
-        domains = set()
-        tlds = set()
-        subdomains = set()
-        dead_errors = set()
-        dup_types = set()
-        folders = set()
+        items = list(self.all_items.values())
 
-        for item in self.all_items.values():
-            browsers.add(item.browser_name)
-            profiles.add(f"{item.browser_name}/{item.profile_name}")
-            if item.url_domain:
-                domains.add(item.url_domain)
-            if item.url_tld:
-                tlds.add(item.url_tld)
-            if item.url_subdomain:
-                subdomains.add(item.url_subdomain)
-            if item.dead_link_detail:
-                dead_errors.add(item.dead_link_detail)
-            if "exact_duplicate" in item.reason:
+        def unique(attr: str) -> List[str]:
+            # map/attrgetter/set run entirely in C for each column
+            values = set(map(attrgetter(attr), items))
+            values.discard(None)
+            values.discard("")
+            return sorted(values)
+
+        dup_types = set()
+        for cat_mask in set(map(attrgetter('cat_mask'), items)):
+            if cat_mask & CAT_EXACT_DUPLICATE:
                 dup_types.add("Exact")
-            if "similar_duplicate" in item.reason:
+            if cat_mask & CAT_SIMILAR_DUPLICATE:
                 dup_types.add("Similar")
-            if item.folder_path:
-                folders.add(item.folder_path)
-
-        self.browser_filter.set_values(list(browsers))
-        self.profile_filter.set_values(list(profiles))
-        self.domain_filter.set_values(list(domains))
-        self.tld_filter.set_values(list(tlds))
-        self.subdomain_filter.set_values(list(subdomains))
-        self.dead_link_filter.set_values(list(dead_errors))
-        self.duplicate_filter.set_values(list(dup_types))
-        self.folder_filter.set_values(list(folders))
+
+        # Values are already unique and sorted - skip the widget's own pass
+        self.browser_filter.set_values(unique('browser_name'), pre_sorted=True)
+        self.profile_filter.set_values(unique('profile_key'), pre_sorted=True)
+        self.domain_filter.set_values(unique('url_domain'), pre_sorted=True)
+        self.tld_filter.set_values(unique('url_tld'), pre_sorted=True)
+        self.subdomain_filter.set_values(unique('url_subdomain'), pre_sorted=True)
+        self.dead_link_filter.set_values(unique('dead_link_detail'), pre_sorted=True)
+        self.duplicate_filter.set_values(sorted(dup_types), pre_sorted=True)
+        self.folder_filter.set_values(unique('folder_path'), pre_sorted=True)
+
+    def _build_filter_index(self):
+        """Index bookmark ids by each filterable value."""
+        categories: Dict[int, Set[int]] = {
+            CAT_DEAD_LINK: set(), CAT_EXACT_DUPLICATE: set(), CAT_SIMILAR_DUPLICATE: set(),
+        }
+        index: Dict[str, Dict[str, Set[int]]] = {name: {} for name in self._FILTER_NAMES}
+
+        def add(name: str, value: Optional[str], bookmark_id: int):
+            if value:
+                index[name].setdefault(value, set()).add(bookmark_id)
+
+        for bid, item in self.all_items.items():
+            for bit, ids in categories.items():
+                if item.cat_mask & bit:
+                    ids.add(bid)
+            add('duplicate', item.dup_type, bid)
+            add('browser', item.browser_name, bid)
+            add('profile', item.profile_key, bid)
+            add('domain', item.url_domain, bid)
+            add('tld', item.url_tld, bid)
+            add('subdomain', item.url_subdomain, bid)
+            add('dead_link', item.dead_link_detail, bid)
+            add('folder', item.folder_path, bid)
+
+        self._category_index = categories
+        self._filter_index = index
+        self._filter_results.clear()
+
+    def _on_filter_changed(self, name: str):
+        """Mark a filter's cached selection stale and schedule a rebuild."""
+        self._dirty_filters.add(name)
+        self.apply_filters()
 
     def apply_filters(self):
+        """Schedule a table rebuild, coalescing rapid filter changes."""
+        self._filter_timer.start()
+
+    def _do_apply_filters(self):
         """Apply all filters and rebuild the table."""
-        self.items_table.blockSignals(True)
-        self.items_table.setSortingEnabled(False)
-        self.items_table.setRowCount(0)
+        self._filter_timer.stop()
         self.visible_items.clear()
 
         # Get filter selections
@@ -804,188 +1182,100 @@ class DeleteBookmarksDialog(QDialog):
         show_exact = self.exact_dups_check.isChecked()
         show_similar = self.similar_dups_check.isChecked()
 
-        browser_sel = self.browser_filter.get_selected()
-        profile_sel = self.profile_filter.get_selected()
-        domain_sel = self.domain_filter.get_selected()
-        tld_sel = self.tld_filter.get_selected()
-        subdomain_sel = self.subdomain_filter.get_selected()
-        dead_sel = self.dead_link_filter.get_selected()
-        dup_sel = self.duplicate_filter.get_selected()
-        folder_sel = self.folder_filter.get_selected()
+        cache = self._filter_cache
+        for name in self._dirty_filters:
+            cache[name] = self.filter_widgets[name].get_selected()
+        self._dirty_filters.clear()
 
-        for item in self.all_items.values():
-            # Category filter
-            passes_cat = False
-            if "dead_link" in item.reason and show_dead:
-                passes_cat = True
-            if "exact_duplicate" in item.reason and show_exact:
-                passes_cat = True
-            if "similar_duplicate" in item.reason and show_similar:
-                passes_cat = True
-            if not passes_cat:
-                continue
-
-            # Browser filter
-            if browser_sel and item.browser_name not in browser_sel:
-                continue
-
-            # Profile filter
-            profile_key = f"{item.browser_name}/{item.profile_name}"
-            if profile_sel and profile_key not in profile_sel:
-                continue
-
-            # Domain filters
-            if domain_sel and item.url_domain not in domain_sel:
-                continue
-            if tld_sel and item.url_tld not in tld_sel:
-                continue
-            if subdomain_sel and (not item.url_subdomain or item.url_subdomain not in subdomain_sel):
-                continue
-
-            # Dead link filter
-            if dead_sel and (not item.dead_link_detail or item.dead_link_detail not in dead_sel):
-                continue
-
-            # Duplicate type filter
-            if dup_sel:
-                item_dup_type = None
-                if "exact_duplicate" in item.reason:
-                    item_dup_type = "Exact"
-                elif "similar_duplicate" in item.reason:
-                    item_dup_type = "Similar"
-                if not item_dup_type or item_dup_type not in dup_sel:
-                    continue
-
-            # Folder filter
-            if folder_sel and (not item.folder_path or item.folder_path not in folder_sel):
-                continue
-
-            # Item passed all filters - add to table
-            self._add_table_row(item)
-            self.visible_items.add(item.bookmark_id)
-
-        self.items_table.setSortingEnabled(True)
-        self.items_table.blockSignals(False)
+        # Category filter - union of the enabled categories
+        wanted = (
+            (CAT_DEAD_LINK if show_dead else 0)
+            | (CAT_EXACT_DUPLICATE if show_exact else 0)
+            | (CAT_SIMILAR_DUPLICATE if show_similar else 0)
+        )
+        selections = tuple((name, cache.get(name)) for name in self._FILTER_NAMES)
+
+        # The same filter state always yields the same rows until the data
+        # is reloaded, so reuse the result when toggling back and forth
+        signature = (wanted, selections)
+        passing = self._filter_results.get(signature)
+        if passing is None:
+            passing = self._filter_items(wanted, selections)
+            if len(self._filter_results) >= self._FILTER_RESULTS_MAX:
+                del self._filter_results[next(iter(self._filter_results))]
+            self._filter_results[signature] = passing
+
+        # A single model reset replaces the rows; the view only builds
+        # cells for what it paints
+        self.items_model.set_items(list(passing))
+        self.visible_items.update(item.bookmark_id for item in passing)
 
         self.count_label.setText(f"{len(self.visible_items)} items shown")
         self.update_preview()
 
-    def _add_table_row(self, item: DeletionItem):
-        """Add a row to the table for an item."""
-        row = self.items_table.rowCount()
-        self.items_table.insertRow(row)
-
-        is_kept = item.group_id is not None and self.keep_in_group.get(item.group_id) == item.bookmark_id
-
-        # Checkbox
-        check_item = QTableWidgetItem()
-        check_item.setData(Qt.ItemDataRole.UserRole, item.bookmark_id)
-        check_item.setData(Qt.ItemDataRole.UserRole + 1, item.group_id)
-        if is_kept:
-            check_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-        else:
-            check_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable)
-            if item.bookmark_id in self.selected_for_deletion:
-                check_item.setCheckState(Qt.CheckState.Checked)
-            else:
-                check_item.setCheckState(Qt.CheckState.Unchecked)
-        self.items_table.setItem(row, 0, check_item)
-
-        # Title
-        title_item = QTableWidgetItem(item.title[:60])
-        title_item.setToolTip(item.title)
-        self.items_table.setItem(row, 1, title_item)
-
-        # URL
-        url_item = QTableWidgetItem(item.url)
-        url_item.setToolTip(item.url)
-        self.items_table.setItem(row, 2, url_item)
-
-        # Folder
-        folder_item = QTableWidgetItem(item.folder_path or "")
-        self.items_table.setItem(row, 3, folder_item)
-
-        # Browser/Profile
-        bp_item = QTableWidgetItem(f"{item.browser_name}/{item.profile_name}")
-        self.items_table.setItem(row, 4, bp_item)
-
-        # Dead Link
-        dead_item = QTableWidgetItem(item.dead_link_detail or "")
-        if item.dead_link_detail:
-            if "404" in item.dead_link_detail:
-                dead_item.setForeground(QBrush(QColor(220, 53, 69)))
-            elif "Timeout" in item.dead_link_detail:
-                dead_item.setForeground(QBrush(QColor(255, 153, 0)))
-        self.items_table.setItem(row, 5, dead_item)
-
-        # Duplicate
-        if is_kept:
-            dup_item = QTableWidgetItem("✓ KEEP")
-            dup_item.setBackground(QBrush(QColor(200, 255, 200)))
-        elif "exact_duplicate" in item.reason:
-            dup_item = QTableWidgetItem("Exact")
-            dup_item.setForeground(QBrush(QColor(220, 53, 69)))
-        elif "similar_duplicate" in item.reason:
-            dup_item = QTableWidgetItem("Similar")
-            dup_item.setForeground(QBrush(QColor(255, 153, 0)))
-        else:
-            dup_item = QTableWidgetItem("")
-        self.items_table.setItem(row, 6, dup_item)
-
-    def on_cell_changed(self, row: int, col: int):
-        """Handle cell change (checkbox toggle)."""
-        if col != 0:
-            return
-
-        item = self.items_table.item(row, 0)
-        if item is None:
-            return
-
-        bookmark_id = item.data(Qt.ItemDataRole.UserRole)
-        if bookmark_id is None:
-            return
-
-        # Check if this is a KEEP item
-        group_id = item.data(Qt.ItemDataRole.UserRole + 1)
-        if group_id is not None and self.keep_in_group.get(group_id) == bookmark_id:
-            return
-
-        if item.checkState() == Qt.CheckState.Checked:
-            self.selected_for_deletion.add(bookmark_id)
-        else:
-            self.selected_for_deletion.discard(bookmark_id)
-
-        self.update_preview()
-
-    def on_selection_changed(self):
+    def _filter_items(
+        self, wanted: int, selections: Tuple[Tuple[str, Optional[FrozenSet[str]]], ...]
+    ) -> Tuple[DeletionItem, ...]:
+        """Items in the wanted categories that match every active filter."""
+        index = self._filter_index
+        allowed: Set[int] = set()
+        for bit, ids in self._category_index.items():
+            if wanted & bit:
+                allowed |= ids
+
+        # Only active filters contribute; each matches the ids having any of
+        # its selected values. Intersect the most selective ones first so the
+        # working set shrinks early, and stop once nothing is left.
+        candidates = [allowed]
+        for name, sel in selections:
+            if sel:
+                postings = index[name]
+                candidates.append(set().union(*(postings.get(value, ()) for value in sel)))
+        candidates.sort(key=len)
+        allowed = candidates[0]
+        for ids in candidates[1:]:
+            if not allowed:
+                break
+            allowed = allowed & ids
+
+        return tuple(item for bid, item in self.all_items.items() if bid in allowed)
+
+    def on_selection_changed(self, selected=None, deselected=None):
         """Handle row selection change."""
-        selected_count = len(self.items_table.selectedItems()) // self.items_table.columnCount()
+        # Keep a running row count from the changed ranges. Rows are always
+        # selected whole, so exactly one range per row covers column 0.
+        if selected is not None:
+            self._highlighted_rows += sum(r.height() for r in selected if r.left() == 0)
+        if deselected is not None:
+            self._highlighted_rows -= sum(r.height() for r in deselected if r.left() == 0)
+        selected_count = self._highlighted_rows
         if selected_count > 0:
             self.selection_label.setText(f"{len(self.selected_for_deletion)} selected for deletion | {selected_count} rows highlighted")
         else:
             self.selection_label.setText(f"{len(self.selected_for_deletion)} selected for deletion")
 
+    def _on_items_reset(self):
+        """A model reset drops the row selection without a selectionChanged."""
+        self._highlighted_rows = 0
+        self.on_selection_changed()
+
     def show_context_menu(self, position):
         """Show context menu."""
-        item = self.items_table.itemAt(position)
+        index = self.items_table.indexAt(position)
+        item = self.items_model.item_at(index.row()) if index.isValid() else None
         if item is None:
             return
 
-        row = item.row()
-        check_item = self.items_table.item(row, 0)
-        if check_item is None:
-            return
-
-        bookmark_id = check_item.data(Qt.ItemDataRole.UserRole)
-        group_id = check_item.data(Qt.ItemDataRole.UserRole + 1)
-        url_item = self.items_table.item(row, 2)
-        url = url_item.text() if url_item else ""
+        row = index.row()
+        bookmark_id = item.bookmark_id
+        group_id = item.group_id
+        url = item.url
 
         menu = QMenu(self)
 
         # Check/uncheck
-        if check_item.flags() & Qt.ItemFlag.ItemIsUserCheckable:
-            if check_item.checkState() == Qt.CheckState.Checked:
+        if not self.items_model.is_kept(item):
+            if bookmark_id in self.selected_for_deletion:
                 action = menu.addAction("Uncheck (Don't Delete)")
                 action.triggered.connect(lambda: self._toggle_row(row, False))
             else:
@@ -1017,18 +1307,10 @@ class DeleteBookmarksDialog(QDialog):
 
     def _toggle_row(self, row: int, checked: bool):
         """Toggle a row's checkbox."""
-        item = self.items_table.item(row, 0)
-        if item and (item.flags() & Qt.ItemFlag.ItemIsUserCheckable):
-            self.items_table.blockSignals(True)
-            item.setCheckState(Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked)
-            self.items_table.blockSignals(False)
-
-            bookmark_id = item.data(Qt.ItemDataRole.UserRole)
-            if checked:
-                self.selected_for_deletion.add(bookmark_id)
-            else:
-                self.selected_for_deletion.discard(bookmark_id)
-            self.update_preview()
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        self.items_model.setData(
+            self.items_model.index(row, 0), state, Qt.ItemDataRole.CheckStateRole
+        )
 
     def _set_as_keep(self, bookmark_id: int, group_id: int):
         """Set a bookmark as the one to keep in its group."""
@@ -1060,7 +1342,11 @@ class DeleteBookmarksDialog(QDialog):
             QMessageBox.information(self, "No Items", "No items are currently visible.")
             return
 
-        urls = [self.all_items[bid].url for bid in self.visible_items if bid in self.all_items]
+        all_items = self.all_items
+        urls = list(map(
+            attrgetter('url'),
+            map(all_items.__getitem__, filter(all_items.__contains__, self.visible_items))
+        ))
 
         from .thumbnail_dialog import ThumbnailDialog
         dialog = ThumbnailDialog(urls, self)
@@ -1068,62 +1354,38 @@ class DeleteBookmarksDialog(QDialog):
 
     def select_all_visible(self):
         """Select all visible items."""
-        self.items_table.blockSignals(True)
-
-        for row in range(self.items_table.rowCount()):
-            item = self.items_table.item(row, 0)
-            if item and (item.flags() & Qt.ItemFlag.ItemIsUserCheckable):
-                item.setCheckState(Qt.CheckState.Checked)
-                bookmark_id = item.data(Qt.ItemDataRole.UserRole)
-                if bookmark_id:
-                    self.selected_for_deletion.add(bookmark_id)
-
-        self.items_table.blockSignals(False)
+        model = self.items_model
+        self.selected_for_deletion.update(model.checkable_ids())
+        model.refresh_checks()
         self.update_preview()
 
     def deselect_all(self):
         """Deselect all items."""
-        self.items_table.blockSignals(True)
         self.selected_for_deletion.clear()
-
-        for row in range(self.items_table.rowCount()):
-            item = self.items_table.item(row, 0)
-            if item and (item.flags() & Qt.ItemFlag.ItemIsUserCheckable):
-                item.setCheckState(Qt.CheckState.Unchecked)
-
-        self.items_table.blockSignals(False)
+        self.items_model.refresh_checks()
         self.update_preview()
 
     def auto_select_duplicates(self):
         """Auto-select duplicates, keeping first non-dead in each group."""
-        groups: Dict[int, List[DeletionItem]] = {}
+        groups: Dict[int, List[DeletionItem]] = defaultdict(list)
         for item in self.all_items.values():
             if item.group_id is not None:
-                if item.group_id not in groups:
-                    groups[item.group_id] = []
                 groups[item.group_id].append(item)
 
+        selected = self.selected_for_deletion
         for group_id, items in groups.items():
             if len(items) < 2:
                 continue
 
-            # Find first non-dead to keep
-            keep_item = None
-            for item in items:
-                if "dead_link" not in item.reason:
-                    keep_item = item
-                    break
-
+            # Keep the first non-dead member; if all are dead select them all
+            keep_item = next((item for item in items if not item.is_dead), None)
+            keep_id = keep_item.bookmark_id if keep_item else None
             if keep_item:
-                self.keep_in_group[group_id] = keep_item.bookmark_id
-                self.selected_for_deletion.discard(keep_item.bookmark_id)
-                for item in items:
-                    if item.bookmark_id != keep_item.bookmark_id:
-                        self.selected_for_deletion.add(item.bookmark_id)
-            else:
-                # All are dead - select all
-                for item in items:
-                    self.selected_for_deletion.add(item.bookmark_id)
+                self.keep_in_group[group_id] = keep_id
+                selected.discard(keep_id)
+            selected.update(
+                item.bookmark_id for item in items if item.bookmark_id != keep_id
+            )
 
         self.apply_filters()
 
@@ -1139,7 +1401,12 @@ class DeleteBookmarksDialog(QDialog):
         self.folder_filter.clear_selection()
 
     def update_preview(self):
+        """Schedule a preview refresh, coalescing bursts of check changes."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self):
         """Update the preview panel."""
+        self._preview_timer.stop()
         self.preview_tree.clear()
 
         count = len(self.selected_for_deletion)
@@ -1155,33 +1422,31 @@ class DeleteBookmarksDialog(QDialog):
             self.summary_label.setText("No items selected for deletion.\n\nUse 'Auto-Select Duplicates' to quickly select duplicates.")
             return
 
-        # Group by browser -> profile
-        by_browser: Dict[str, Dict[str, List[DeletionItem]]] = {}
-        for bid in self.selected_for_deletion:
-            if bid not in self.all_items:
-                continue
-            item = self.all_items[bid]
-            if item.browser_name not in by_browser:
-                by_browser[item.browser_name] = {}
-            if item.profile_name not in by_browser[item.browser_name]:
-                by_browser[item.browser_name][item.profile_name] = []
-            by_browser[item.browser_name][item.profile_name].append(item)
+        # Group by browser -> profile, counting every item but keeping only
+        # the few that are shown
+        limit = self._PREVIEW_ITEMS_PER_PROFILE
+        counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        shown: Dict[Tuple[str, str], List[DeletionItem]] = defaultdict(list)
+        for item in self._selected_items():
+            counts[item.browser_name][item.profile_name] += 1
+            sample = shown[item.browser_name, item.profile_name]
+            if len(sample) < limit:
+                sample.append(item)
 
         # Build tree
-        for browser, profiles in sorted(by_browser.items()):
-            browser_count = sum(len(items) for items in profiles.values())
+        for browser, profiles in sorted(counts.items()):
+            browser_count = sum(profiles.values())
             browser_item = QTreeWidgetItem([f"🌐 {browser}", f"{browser_count}"])
             browser_item.setExpanded(True)
 
-            for profile, items in sorted(profiles.items()):
-                profile_item = QTreeWidgetItem([f"👤 {profile}", f"{len(items)}"])
-                for item in items[:15]:
-                    title = item.title[:35] + "..." if len(item.title) > 35 else item.title
-                    bookmark_item = QTreeWidgetItem([f"📄 {title}", ""])
+            for profile, profile_count in sorted(profiles.items()):
+                profile_item = QTreeWidgetItem([f"👤 {profile}", f"{profile_count}"])
+                for item in shown[browser, profile]:
+                    bookmark_item = QTreeWidgetItem([f"📄 {item.short_title}", ""])
                     bookmark_item.setToolTip(0, f"{item.title}\n{item.url}")
                     profile_item.addChild(bookmark_item)
-                if len(items) > 15:
-                    more = QTreeWidgetItem([f"... +{len(items) - 15} more", ""])
+                if profile_count > limit:
+                    more = QTreeWidgetItem([f"... +{profile_count - limit} more", ""])
                     profile_item.addChild(more)
                 profile_item.setExpanded(True)
                 browser_item.addChild(profile_item)
@@ -1214,7 +1479,7 @@ class DeleteBookmarksDialog(QDialog):
         if not self.selected_for_deletion:
             return
 
-        selected_items = [self.all_items[bid] for bid in self.selected_for_deletion if bid in self.all_items]
+        selected_items = list(self._selected_items())
         affected_browsers = {item.browser_name for item in selected_items}
 
         # Check running browsers
@@ -1274,12 +1539,17 @@ class DeleteBookmarksDialog(QDialog):
             success_count = sum(r.bookmarks_deleted for r in results if r.success)
             QMessageBox.information(self, "Done", f"Deleted {success_count} bookmarks.\n\nBackups saved to:\n{self.modifier_service.backup_dir}")
 
-            # Remove from database
-            for item in items:
-                try:
-                    self.db.execute("DELETE FROM bookmarks WHERE bookmark_id = ?", (item.bookmark_id,))
-                except Exception:
-                    pass
+            # Remove from database in one batch; if a row fails, retry one by
+            # one so the remaining rows are still removed
+            params = [(item.bookmark_id,) for item in items]
+            try:
+                self.db.executemany(self._SQL_DELETE_BOOKMARK, params)
+            except Exception:
+                for param in params:
+                    try:
+                        self.db.execute(self._SQL_DELETE_BOOKMARK, param)
+                    except Exception:
+                        pass
             self.db.commit()
 
             self.load_data()
@@ -1288,26 +1558,40 @@ class DeleteBookmarksDialog(QDialog):
             progress.close()
             QMessageBox.critical(self, "Error", str(e))
 
+    def _selected_items(self) -> Iterable[DeletionItem]:
+        """Items selected for deletion."""
+        return map(self.all_items.__getitem__, self.selected_for_deletion)
+
     def _get_selected_ids_text(self) -> str:
         """Get browser bookmark IDs as text."""
-        items = [self.all_items[bid] for bid in self.selected_for_deletion if bid in self.all_items]
-        return '\n'.join(str(item.browser_bookmark_id) for item in items)
+        return '\n'.join(str(item.browser_bookmark_id) for item in self._selected_items())
 
     def _create_backups_for_selected(self) -> str:
         """Create backups for selected profiles."""
-        items = [self.all_items[bid] for bid in self.selected_for_deletion if bid in self.all_items]
-        profiles = {}
-        for item in items:
-            key = (item.profile_path, item.browser_name, item.profile_name)
-            profiles[key] = key
-
-        results = []
-        for profile_path, browser_name, profile_name in profiles.keys():
+        # Sorted by browser and profile name so the report reads the same
+        # on every run
+        profiles = sorted(
+            {
+                (item.profile_path, item.browser_name, item.profile_name)
+                for item in self._selected_items()
+            },
+            key=lambda profile: (profile[1], profile[2], profile[0])
+        )
+        if not profiles:
+            return ""
+
+        def backup(profile: Tuple[str, str, str]) -> str:
+            profile_path, browser_name, profile_name = profile
             try:
                 self.modifier_service.create_backup(Path(profile_path), browser_name, profile_name)
-                results.append(f"  • {browser_name}/{profile_name}")
-            except Exception as e:
-                results.append(f"  • {browser_name}/{profile_name}: FAILED")
+                return f"  • {browser_name}/{profile_name}"
+            except Exception:
+                return f"  • {browser_name}/{profile_name}: FAILED"
+
+        # Each profile is an independent file copy, so run them concurrently;
+        # map() still returns the results in profile order
+        with ThreadPoolExecutor(max_workers=min(8, len(profiles))) as executor:
+            results = list(executor.map(backup, profiles))
         return "\n".join(results)
 
     def copy_ids_to_clipboard(self):
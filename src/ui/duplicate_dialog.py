@@ -1,10 +1,16 @@
 """Duplicate Bookmark Detection Dialog."""
 
+import multiprocessing
+import sqlite3
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from urllib.parse import urlparse, parse_qs, urlencode
-from typing import Optional
+from functools import lru_cache
+from itertools import repeat
+from urllib.parse import urlparse
+from typing import Callable, Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar,
     QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
@@ -14,6 +20,7 @@ from PyQt6.QtCore import QThread, pyqtSignal, Qt
 
 from ..models.database import Database, get_database
 from ..models.bookmark import Bookmark
+from ..utils.url import normalize_url
 
 
 @dataclass
@@ -25,52 +32,7 @@ class DuplicateGroup:
     similarity: float = 1.0  # For similar matches, how similar (0-1)
 
 
-def normalize_url(url: str) -> str:
-    """
-    Normalize a URL for exact duplicate detection.
-    - Removes trailing slashes
-    - Lowercases the domain
-    - Sorts query parameters
-    - Removes common tracking parameters
-    """
-    try:
-        parsed = urlparse(url.strip())
-
-        # Lowercase the netloc (domain)
-        netloc = parsed.netloc.lower()
-
-        # Remove www. prefix for comparison
-        if netloc.startswith('www.'):
-            netloc = netloc[4:]
-
-        # Normalize path - remove trailing slash
-        path = parsed.path.rstrip('/') or '/'
-
-        # Parse and sort query parameters, removing tracking params
-        tracking_params = {
-            'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-            'fbclid', 'gclid', 'ref', 'source', 'mc_cid', 'mc_eid'
-        }
-
-        if parsed.query:
-            params = parse_qs(parsed.query, keep_blank_values=True)
-            # Remove tracking parameters
-            filtered_params = {k: v for k, v in params.items() if k.lower() not in tracking_params}
-            # Sort and rebuild query string
-            sorted_query = urlencode(sorted(filtered_params.items()), doseq=True)
-        else:
-            sorted_query = ''
-
-        # Rebuild URL without fragment
-        normalized = f"{parsed.scheme}://{netloc}{path}"
-        if sorted_query:
-            normalized += f"?{sorted_query}"
-
-        return normalized
-    except Exception:
-        return url.strip().lower()
-
-
+@lru_cache(maxsize=200_000)
 def get_url_signature(url: str) -> str:
     """
     Get a simplified signature for fuzzy matching.
@@ -87,11 +49,177 @@ def get_url_signature(url: str) -> str:
         return url.strip().lower()
 
 
+def signature_from_normalized(normalized_url: str) -> str:
+    """
+    Get the signature of a URL returned by normalize_url.
+
+    The normalized form is already scheme://netloc/path?query with a
+    lowercased netloc and trimmed path, so the signature can be cut out of
+    it without parsing the URL again. Unusual shapes fall back to
+    get_url_signature.
+    """
+    scheme, sep, rest = normalized_url.partition('://')
+    host_path = rest.split('?', 1)[0]
+    netloc, slash, _ = host_path.partition('/')
+    if (sep and slash and netloc and scheme.isalpha() and netloc == netloc.lower()
+            and '[' not in netloc and ']' not in netloc and '#' not in host_path
+            and host_path.isprintable() and host_path[-1] != ' '):
+        return host_path[4:] if host_path.startswith('www.') else host_path
+    return get_url_signature(normalized_url)
+
+
+def signature_similarity(sig1: str, sig2: str) -> float:
+    """Calculate similarity between two URL signatures (0-1)."""
+    return SequenceMatcher(None, sig1, sig2).ratio()
+
+
 def url_similarity(url1: str, url2: str) -> float:
     """Calculate similarity between two URLs (0-1)."""
-    sig1 = get_url_signature(url1)
-    sig2 = get_url_signature(url2)
-    return SequenceMatcher(None, sig1, sig2).ratio()
+    return signature_similarity(get_url_signature(url1), get_url_signature(url2))
+
+
+def block_by_domain(
+    signatures: List[str], threshold: float,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> Optional[List[Tuple[List[int], Optional[List[int]]]]]:
+    """
+    Split signature indices into blocks of URLs worth comparing.
+
+    URLs are grouped by their host's last two labels, so subdomains of a site
+    share a block, and each block is compared among itself (second item None).
+    URLs in two different blocks are only compared (as a cross block) when the
+    block domains are themselves at least threshold similar.
+
+    Comparing the domains is quadratic in their number, so is_cancelled is
+    checked and on_progress(done, total) called once per domain. Returns
+    None if cancelled.
+    """
+    by_domain: Dict[str, List[int]] = {}
+    for i, sig in enumerate(signatures):
+        host = sig.split('/', 1)[0].rsplit(':', 1)[0]
+        domain = '.'.join(host.rsplit('.', 2)[-2:])
+        by_domain.setdefault(domain, []).append(i)
+
+    blocks: List[Tuple[List[int], Optional[List[int]]]] = [(ids, None) for ids in by_domain.values()]
+
+    # Sorted by length, a shorter domain can only match while the length
+    # ratio alone still allows reaching the threshold. Each domain is paired
+    # with the shorter ones before it, as the matcher's second sequence, so
+    # difflib indexes it once rather than once per pair
+    domains = sorted(by_domain, key=len)
+    matcher = SequenceMatcher(None)
+    similar = []
+    for b, domain2 in enumerate(domains):
+        if is_cancelled is not None and is_cancelled():
+            return None
+        if on_progress is not None:
+            on_progress(b, len(domains))
+        len2 = len(domain2)
+        matcher.set_seq2(domain2)
+        for a in range(b - 1, -1, -1):
+            domain1 = domains[a]
+            len1 = len(domain1)
+            if 2 * len1 < threshold * (len1 + len2):
+                break
+            matcher.set_seq1(domain1)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            if matcher.ratio() >= threshold:
+                similar.append((a, b))
+
+    for a, b in sorted(similar):
+        blocks.append((by_domain[domains[a]], by_domain[domains[b]]))
+    return blocks
+
+
+def score_block(
+    block1: List[Tuple[int, str]], block2: Optional[List[Tuple[int, str]]], threshold: float,
+    start: int = 0, stop: Optional[int] = None
+) -> List[Tuple[int, int, float]]:
+    """
+    Score the signature pairs of a block from block_by_domain.
+
+    Blocks hold (index, signature) pairs. Only rows start:stop of block1 are
+    scored, so one large block can be split across several tasks. Returns
+    (i, j, similarity) with i < j for every pair at least threshold but not
+    identical. Module level so it can run in a worker process.
+    """
+    matches = []
+    others = block1 if block2 is None else block2
+    # The row's signature stays the matcher's second sequence, so difflib
+    # builds its b2j index once per row instead of once per pair
+    row_matcher = SequenceMatcher(None)
+    for a in range(start, len(block1) if stop is None else stop):
+        first, sig_first = block1[a]
+        row_ready = False
+        # A block scored against itself walks the lower triangle, where the
+        # row always holds the larger index; index into the other block
+        # rather than slicing a copy of it
+        for b in range(a if block2 is None else len(others)):
+            second, sig_second = others[b]
+
+            # Cheap upper bounds on ratio() first: the length ratio, then
+            # difflib's character-multiset bound
+            len1, len2 = len(sig_first), len(sig_second)
+            if 2 * min(len1, len2) < threshold * (len1 + len2):
+                continue
+            # ratio() is not symmetric, so the smaller index stays first
+            if second < first:
+                if not row_ready:
+                    row_matcher.set_seq2(sig_first)
+                    row_ready = True
+                row_matcher.set_seq1(sig_second)
+                matcher = row_matcher
+                i, j = second, first
+            else:
+                matcher = SequenceMatcher(None, sig_first, sig_second)
+                i, j = first, second
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+
+            similarity = matcher.ratio()
+            if similarity >= threshold and similarity < 1.0:
+                matches.append((i, j, similarity))
+    return matches
+
+
+def cluster_matches(matches: List[Tuple[int, int, float]]) -> List[Tuple[List[int], float]]:
+    """
+    Merge similar pairs into connected components with union-find.
+
+    Returns (indices, similarity) per component, where indices are sorted
+    and similarity is the weakest pair that joined the component, so A~B and
+    B~C become one group instead of two overlapping ones.
+    """
+    parent = {}
+    size = {}
+
+    def find(i: int) -> int:
+        root = parent.setdefault(i, i)
+        while parent[root] != root:
+            # Path halving keeps later lookups short
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    for i, j, _ in matches:
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            continue
+        if size.get(root_i, 1) < size.get(root_j, 1):
+            root_i, root_j = root_j, root_i
+        parent[root_j] = root_i
+        size[root_i] = size.get(root_i, 1) + size.get(root_j, 1)
+
+    members = {}
+    weakest = {}
+    for i in parent:
+        members.setdefault(find(i), []).append(i)
+    for i, _, similarity in matches:
+        root = find(i)
+        weakest[root] = min(similarity, weakest.get(root, similarity))
+    return sorted((sorted(indices), weakest[root]) for root, indices in members.items())
 
 
 class DuplicateFinderWorker(QThread):
@@ -103,6 +231,45 @@ class DuplicateFinderWorker(QThread):
     finished_checking = pyqtSignal(str)  # check_run_id
     error_occurred = pyqtSignal(str)
 
+    # Below this many signature pairs, starting worker processes costs more
+    # than it saves
+    _PARALLEL_MIN_PAIRS = 200_000
+    # Below this many bookmarks missing a normalized URL, they are filled in
+    # inside SQLite rather than in worker processes
+    _PARALLEL_MIN_BOOKMARKS = 5000
+    # Rows of a block scored per task, so one huge domain block is spread
+    # over every worker instead of pinning a single one
+    _ROWS_PER_TASK = 1024
+
+    # Minimum seconds between progress signals (~30 per second), so large
+    # runs don't flood the GUI event queue
+    _PROGRESS_INTERVAL = 1 / 30
+
+    _SQL_COUNT = "SELECT COUNT(*) FROM bookmarks"
+    _SQL_COUNT_UNNORMALIZED = "SELECT COUNT(*) FROM bookmarks WHERE normalized_url IS NULL"
+    _SQL_SELECT_UNNORMALIZED = "SELECT bookmark_id, url FROM bookmarks WHERE normalized_url IS NULL"
+    _SQL_NORMALIZE = """
+        UPDATE bookmarks SET normalized_url = normalize_url(url)
+        WHERE normalized_url IS NULL
+    """
+    _SQL_SET_NORMALIZED = "UPDATE bookmarks SET normalized_url = ? WHERE bookmark_id = ?"
+    # Members of a URL keep Bookmark.get_all order (position, title), which
+    # decides the default bookmark to keep
+    _SQL_URL_MEMBERS = """
+        SELECT normalized_url, bookmark_id
+        FROM bookmarks
+        ORDER BY normalized_url, position, title, bookmark_id
+    """
+
+    _SQL_INSERT_GROUP = """
+        INSERT INTO duplicate_groups (check_run_id, normalized_url, match_type, similarity)
+        VALUES (?, ?, ?, ?)
+    """
+    _SQL_INSERT_MEMBER = """
+        INSERT INTO duplicate_group_members (duplicate_group_id, bookmark_id)
+        VALUES (?, ?)
+    """
+
     def __init__(self, db_path: str, similarity_threshold: float = 0.85):
         super().__init__()
         self.db_path = db_path
@@ -113,6 +280,80 @@ class DuplicateFinderWorker(QThread):
         """Request cancellation."""
         self._cancelled = True
 
+    # Stay well below SQLite's limit on host parameters per statement
+    _IN_CHUNK_SIZE = 500
+
+    def _load_bookmarks(self, db: Database, bookmark_ids) -> Dict[int, Bookmark]:
+        """Fetch only the given bookmarks, keyed by ID."""
+        bookmark_ids = list(bookmark_ids)
+        bookmarks_by_id = {}
+        for start in range(0, len(bookmark_ids), self._IN_CHUNK_SIZE):
+            chunk = bookmark_ids[start:start + self._IN_CHUNK_SIZE]
+            cursor = db.execute(
+                f"SELECT * FROM bookmarks WHERE bookmark_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for row in cursor:
+                bookmark = Bookmark.from_row(row)
+                bookmarks_by_id[bookmark.bookmark_id] = bookmark
+        return bookmarks_by_id
+
+    def _normalize_in_sqlite(self, db: Database) -> bool:
+        """Fill in missing normalized URLs with one UPDATE; False if cancelled."""
+        # SQLite calls normalize_url once per row; a progress handler aborts
+        # the statement if the search is cancelled
+        conn = db.connect()
+        conn.create_function("normalize_url", 1, normalize_url, deterministic=True)
+        conn.set_progress_handler(lambda: self._cancelled, 10000)
+        try:
+            db.execute(self._SQL_NORMALIZE)
+        except sqlite3.OperationalError:
+            if self._cancelled:
+                conn.rollback()
+                return False
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+        db.commit()
+        return True
+
+    @staticmethod
+    def _process_pool() -> ProcessPoolExecutor:
+        """Start a pool of spawned worker processes.
+
+        This runs on a QThread inside the GUI process; forking it would copy
+        Qt and SQLite state, and any lock another thread holds, into the
+        children.
+        """
+        return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+    def _normalize_in_processes(self, db: Database) -> bool:
+        """Fill in missing normalized URLs on all cores; False if cancelled."""
+        rows = db.execute(self._SQL_SELECT_UNNORMALIZED).fetchall()
+        updates = []
+        with self._process_pool() as executor:
+            normalized = executor.map(normalize_url, [url for _, url in rows], chunksize=1024)
+            for (bookmark_id, _), normalized_url in zip(rows, normalized):
+                if self._cancelled:
+                    executor.shutdown(cancel_futures=True)
+                    return False
+                updates.append((normalized_url, bookmark_id))
+        db.executemany(self._SQL_SET_NORMALIZED, updates)
+        db.commit()
+        return True
+
+    def _save_groups(self, db: Database, check_run_id: str, groups: List[DuplicateGroup]):
+        """Save duplicate groups, inserting all their members in one batch."""
+        member_rows = []
+        for group in groups:
+            cursor = db.execute(self._SQL_INSERT_GROUP, (
+                check_run_id, group.canonical_url, group.match_type, group.similarity
+            ))
+            group_id = cursor.lastrowid
+            member_rows.extend((group_id, bookmark.bookmark_id) for bookmark in group.bookmarks)
+        db.executemany(self._SQL_INSERT_MEMBER, member_rows)
+        db.commit()
+
     def run(self):
         """Find duplicates."""
         try:
@@ -123,10 +364,9 @@ class DuplicateFinderWorker(QThread):
             db = Database(self.db_path)
             db.initialize_schema()
 
-            # Get all bookmarks
-            bookmarks = Bookmark.get_all(db)
-
-            total = len(bookmarks)
+            # Only the row count is needed up front; full bookmarks are
+            # fetched later for the ones that end up in a group
+            total = db.execute(self._SQL_COUNT).fetchone()[0]
             if total == 0:
                 self.exact_duplicates_found.emit([], check_run_id)
                 self.similar_duplicates_found.emit([], check_run_id)
@@ -137,98 +377,141 @@ class DuplicateFinderWorker(QThread):
             # Phase 1: Find exact duplicates (by normalized URL)
             self.progress_updated.emit(0, total, "Finding exact duplicates...")
 
-            url_to_bookmarks = {}
-            for i, bookmark in enumerate(bookmarks):
-                if self._cancelled:
-                    db.close()
-                    return
+            # Bookmarks store their normalized URL when saved; only rows from
+            # before that column existed still need normalizing. It is pure
+            # CPU work, so large backlogs are spread over worker processes
+            unnormalized = db.execute(self._SQL_COUNT_UNNORMALIZED).fetchone()[0]
+            if unnormalized >= self._PARALLEL_MIN_BOOKMARKS:
+                normalized = self._normalize_in_processes(db)
+            else:
+                normalized = unnormalized == 0 or self._normalize_in_sqlite(db)
+            if not normalized:
+                db.close()
+                return
 
-                normalized = normalize_url(bookmark.url)
-                if normalized not in url_to_bookmarks:
-                    url_to_bookmarks[normalized] = []
-                url_to_bookmarks[normalized].append(bookmark)
+            url_to_ids = {}
+            for normalized_url, bookmark_id in db.execute(self._SQL_URL_MEMBERS):
+                url_to_ids.setdefault(normalized_url, []).append(bookmark_id)
 
-                if i % 100 == 0:
-                    self.progress_updated.emit(i, total, "Finding exact duplicates...")
+            self.progress_updated.emit(total, total, "Finding exact duplicates...")
 
             # Filter to only groups with duplicates and save to database
+            exact_urls = [url for url, ids in url_to_ids.items() if len(ids) > 1]
+            bookmarks_by_id = self._load_bookmarks(
+                db, (bookmark_id for url in exact_urls for bookmark_id in url_to_ids[url])
+            )
             exact_groups = []
-            for normalized_url, group_bookmarks in url_to_bookmarks.items():
-                if len(group_bookmarks) > 1:
-                    group = DuplicateGroup(
-                        canonical_url=normalized_url,
-                        bookmarks=group_bookmarks,
-                        match_type="exact",
-                        similarity=1.0
-                    )
-                    exact_groups.append(group)
-
-                    # Save to database
-                    cursor = db.execute("""
-                        INSERT INTO duplicate_groups (check_run_id, normalized_url, match_type, similarity)
-                        VALUES (?, ?, ?, ?)
-                    """, (check_run_id, normalized_url, "exact", 1.0))
-                    group_id = cursor.lastrowid
-
-                    # Save group members
-                    for bookmark in group_bookmarks:
-                        db.execute("""
-                            INSERT INTO duplicate_group_members (duplicate_group_id, bookmark_id)
-                            VALUES (?, ?)
-                        """, (group_id, bookmark.bookmark_id))
-
-            db.commit()
+            for normalized_url in exact_urls:
+                group = DuplicateGroup(
+                    canonical_url=normalized_url,
+                    bookmarks=[bookmarks_by_id[i] for i in url_to_ids[normalized_url]],
+                    match_type="exact",
+                    similarity=1.0
+                )
+                exact_groups.append(group)
+
+            self._save_groups(db, check_run_id, exact_groups)
             self.exact_duplicates_found.emit(exact_groups, check_run_id)
 
             # Phase 2: Find similar URLs (fuzzy matching)
             # Only compare unique normalized URLs to avoid redundant comparisons
-            self.progress_updated.emit(0, len(url_to_bookmarks), "Finding similar URLs...")
+            self.progress_updated.emit(0, len(url_to_ids), "Finding similar URLs...")
+
+            unique_urls = list(url_to_ids.keys())
+            # Signatures are computed once per URL rather than twice per pair
+            signatures = [signature_from_normalized(url) for url in unique_urls]
+            similar_matches = []
+
+            # Only URLs on the same (or a similar) domain can be similar
+            last_emit = time.monotonic()
+
+            def domains_progress(done: int, domain_total: int):
+                nonlocal last_emit
+                now = time.monotonic()
+                if now - last_emit >= self._PROGRESS_INTERVAL:
+                    self.progress_updated.emit(done, domain_total, "Comparing domains...")
+                    last_emit = now
+
+            blocks = block_by_domain(
+                signatures, self.similarity_threshold,
+                lambda: self._cancelled, domains_progress
+            )
+            if blocks is None:
+                db.close()
+                return
 
-            unique_urls = list(url_to_bookmarks.keys())
-            similar_groups = []
-            processed_pairs = set()
+            # Blocks are independent, so large runs score them on all cores
+            work = []
+            for block1, block2 in blocks:
+                sigs1 = [(i, signatures[i]) for i in block1]
+                sigs2 = None if block2 is None else [(j, signatures[j]) for j in block2]
+                for start in range(0, len(sigs1), self._ROWS_PER_TASK):
+                    work.append((sigs1, sigs2, start, min(start + self._ROWS_PER_TASK, len(sigs1))))
+            pair_count = sum(
+                len(block1) * (len(block1) - 1) // 2 if block2 is None else len(block1) * len(block2)
+                for block1, block2 in blocks
+            )
+            executor = self._process_pool() if pair_count >= self._PARALLEL_MIN_PAIRS else None
+            try:
+                if executor:
+                    results = executor.map(
+                        score_block,
+                        [block1 for block1, _, _, _ in work],
+                        [block2 for _, block2, _, _ in work],
+                        repeat(self.similarity_threshold),
+                        [start for _, _, start, _ in work],
+                        [stop for _, _, _, stop in work],
+                    )
+                else:
+                    results = (
+                        score_block(block1, block2, self.similarity_threshold, start, stop)
+                        for block1, block2, start, stop in work
+                    )
 
-            for i, url1 in enumerate(unique_urls):
-                if self._cancelled:
-                    db.close()
-                    return
-
-                if i % 10 == 0:
-                    self.progress_updated.emit(i, len(unique_urls), "Finding similar URLs...")
-
-                for j, url2 in enumerate(unique_urls[i+1:], i+1):
-                    pair_key = (min(url1, url2), max(url1, url2))
-                    if pair_key in processed_pairs:
-                        continue
-                    processed_pairs.add(pair_key)
-
-                    similarity = url_similarity(url1, url2)
-                    if similarity >= self.similarity_threshold and similarity < 1.0:
-                        # Combine bookmarks from both URLs
-                        combined_bookmarks = url_to_bookmarks[url1] + url_to_bookmarks[url2]
-                        group = DuplicateGroup(
-                            canonical_url=f"{url1} <-> {url2}",
-                            bookmarks=combined_bookmarks,
-                            match_type="similar",
-                            similarity=similarity
-                        )
-                        similar_groups.append(group)
-
-                        # Save to database
-                        cursor = db.execute("""
-                            INSERT INTO duplicate_groups (check_run_id, normalized_url, match_type, similarity)
-                            VALUES (?, ?, ?, ?)
-                        """, (check_run_id, f"{url1} <-> {url2}", "similar", similarity))
-                        group_id = cursor.lastrowid
-
-                        # Save group members
-                        for bookmark in combined_bookmarks:
-                            db.execute("""
-                                INSERT INTO duplicate_group_members (duplicate_group_id, bookmark_id)
-                                VALUES (?, ?)
-                            """, (group_id, bookmark.bookmark_id))
-
-            db.commit()
+                last_emit = time.monotonic()
+                for b, matches in enumerate(results):
+                    if self._cancelled:
+                        db.close()
+                        return
+
+                    now = time.monotonic()
+                    if now - last_emit >= self._PROGRESS_INTERVAL:
+                        self.progress_updated.emit(b, len(work), "Finding similar URLs...")
+                        last_emit = now
+
+                    # Domain blocks partition the URLs, so each pair is
+                    # scored in exactly one block and needs no dedup
+                    similar_matches.extend(matches)
+            finally:
+                if executor:
+                    executor.shutdown(cancel_futures=True)
+
+            # One group per cluster of transitively similar URLs
+            clusters = [
+                ([unique_urls[i] for i in indices], similarity)
+                for indices, similarity in cluster_matches(similar_matches)
+            ]
+
+            # Fetch the bookmarks behind the matched URLs not already loaded
+            bookmarks_by_id.update(self._load_bookmarks(db, {
+                bookmark_id
+                for urls, _ in clusters
+                for url in urls
+                for bookmark_id in url_to_ids[url]
+                if bookmark_id not in bookmarks_by_id
+            }))
+            similar_groups = []
+            for urls, similarity in clusters:
+                # Combine bookmarks from all URLs in the cluster
+                group = DuplicateGroup(
+                    canonical_url=" <-> ".join(urls),
+                    bookmarks=[bookmarks_by_id[i] for url in urls for i in url_to_ids[url]],
+                    match_type="similar",
+                    similarity=similarity
+                )
+                similar_groups.append(group)
+
+            self._save_groups(db, check_run_id, similar_groups)
             self.similar_duplicates_found.emit(similar_groups, check_run_id)
             self.progress_updated.emit(total, total, "Complete!")
             self.finished_checking.emit(check_run_id)
@@ -241,6 +524,9 @@ class DuplicateFinderWorker(QThread):
 class DuplicateDialog(QDialog):
     """Dialog for finding and displaying duplicate bookmarks."""
 
+    # Signal to notify parent that a search ran and wrote duplicate groups
+    data_changed = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = get_database()
@@ -372,12 +658,17 @@ class DuplicateDialog(QDialog):
             self.db.db_path,
             similarity_threshold=self.threshold_spin.value() / 100.0
         )
-        self.worker.progress_updated.connect(self.on_progress_updated)
+        self.worker.progress_updated.connect(
+            self.on_progress_updated, Qt.ConnectionType.QueuedConnection
+        )
         self.worker.exact_duplicates_found.connect(self.on_exact_found)
         self.worker.similar_duplicates_found.connect(self.on_similar_found)
         self.worker.finished_checking.connect(self.on_finished)
         self.worker.error_occurred.connect(self.on_error)
         self.worker.start()
+        # Exact groups are saved before the similar phase, so even a
+        # cancelled search may have written results
+        self.data_changed.emit()
 
     def cancel_search(self):
         """Cancel the search."""
@@ -403,16 +694,8 @@ class DuplicateDialog(QDialog):
         self.tab_widget.setTabText(0, f"Exact Duplicates ({total_duplicates})")
 
         # Populate table - show each bookmark in duplicate groups
-        for group in groups:
-            for bookmark in group.bookmarks:
-                row = self.exact_table.rowCount()
-                self.exact_table.insertRow(row)
-
-                self.exact_table.setItem(row, 0, QTableWidgetItem(bookmark.title or "(no title)"))
-                self.exact_table.setItem(row, 1, QTableWidgetItem(bookmark.url))
-                self.exact_table.setItem(row, 2, QTableWidgetItem(""))  # TODO: folder name
-                self.exact_table.setItem(row, 3, QTableWidgetItem(""))  # TODO: profile name
-                self.exact_table.setItem(row, 4, QTableWidgetItem(str(len(group.bookmarks))))
+        self._populate_table(self.exact_table, groups, total_duplicates,
+                             lambda group: str(len(group.bookmarks)))
 
     def on_similar_found(self, groups: list, check_run_id: str):
         """Handle similar URLs found."""
@@ -422,16 +705,29 @@ class DuplicateDialog(QDialog):
         self.tab_widget.setTabText(1, f"Similar URLs ({total_similar})")
 
         # Populate table
-        for group in groups:
-            for bookmark in group.bookmarks:
-                row = self.similar_table.rowCount()
-                self.similar_table.insertRow(row)
-
-                self.similar_table.setItem(row, 0, QTableWidgetItem(bookmark.title or "(no title)"))
-                self.similar_table.setItem(row, 1, QTableWidgetItem(bookmark.url))
-                self.similar_table.setItem(row, 2, QTableWidgetItem(""))  # TODO: folder name
-                self.similar_table.setItem(row, 3, QTableWidgetItem(""))  # TODO: profile name
-                self.similar_table.setItem(row, 4, QTableWidgetItem(f"{group.similarity:.0%}"))
+        self._populate_table(self.similar_table, groups, total_similar,
+                             lambda group: f"{group.similarity:.0%}")
+
+    def _populate_table(self, table: QTableWidget, groups: list, row_count: int, group_text):
+        """Append one row per grouped bookmark, allocating all rows at once."""
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            row = table.rowCount()
+            table.setRowCount(row + row_count)
+            for group in groups:
+                last_column = group_text(group)
+                for bookmark in group.bookmarks:
+                    table.setItem(row, 0, QTableWidgetItem(bookmark.title or "(no title)"))
+                    table.setItem(row, 1, QTableWidgetItem(bookmark.url))
+                    # Columns 2 and 3 are left without items (shown empty)
+                    # TODO: folder name, profile name
+                    table.setItem(row, 4, QTableWidgetItem(last_column))
+                    row += 1
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
 
     def on_finished(self, check_run_id: str):
         """Handle search completion."""
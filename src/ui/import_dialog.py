@@ -1,5 +1,10 @@
 """Import dialog with progress bar for importing bookmarks from browsers."""
 
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -13,55 +18,128 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QWidget,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
 from ..models.database import Database
-from ..services.import_service import ImportService, ImportProgress, ImportResult
-from ..services.profile_detector import ProfileDetector, DetectedProfile
+from ..services.import_service import ImportService, ImportProgress, ImportResult, ImportCancelled
+from ..services.profile_detector import DetectedProfile, get_profile_detector
 
 
 class ImportWorker(QThread):
     """Worker thread to run import without blocking the UI."""
 
     # Signals to communicate with the main thread
-    progress_updated = pyqtSignal(object)  # ImportProgress
+    progress_updated = pyqtSignal(str, int, int, str)  # phase, current, total, title
     profile_started = pyqtSignal(str, str)  # browser_name, profile_name
     profile_finished = pyqtSignal(object)  # ImportResult
     import_finished = pyqtSignal(list)  # List[ImportResult]
     error_occurred = pyqtSignal(str)
 
+    # Minimum seconds between progress signals (~30 per second), so large
+    # imports don't flood the GUI event queue
+    _PROGRESS_INTERVAL = 1 / 30
+
+    # Above this many bookmarks, secondary indexes the import never queries
+    # are dropped and rebuilt in one pass afterwards, instead of being
+    # updated on every insert. The profile/browser-ID lookups keep theirs.
+    _LARGE_IMPORT_BOOKMARKS = 1000
+    _DEFERRED_INDEXES = (
+        "idx_bookmarks_url", "idx_bookmarks_normalized_url",
+        "idx_bookmarks_folder", "idx_folders_parent",
+    )
+
     def __init__(self, profiles_to_import: list, db_path):
         super().__init__()
         self.profiles_to_import = profiles_to_import
         self.db_path = db_path
-        self._is_cancelled = False
+        # Set from the GUI thread and polled by the import once per batch
+        self._cancel_event = threading.Event()
+        self._last_emit = 0.0
+        self._last_phase = None
+
+    def _drop_deferred_indexes(self, db: Database) -> list:
+        """Drop the deferred indexes, returning the SQL to recreate them."""
+        placeholders = ",".join("?" * len(self._DEFERRED_INDEXES))
+        rows = db.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND name IN ({placeholders})",
+            self._DEFERRED_INDEXES,
+        ).fetchall()
+        with db.transaction():
+            for name, _ in rows:
+                db.execute(f"DROP INDEX {name}")
+        return [sql for _, sql in rows]
 
     def run(self):
         """Run the import process."""
         # Create a new database connection for this thread
-        # SQLite connections cannot be shared across threads
+        # SQLite connections cannot be shared across threads. The dialog's
+        # get_database() has already created the schema, so the worker
+        # skips initialize_schema() and only opens the connection.
         db = Database(self.db_path)
-        db.initialize_schema()
+        # The bulk import keeps its temporary b-trees in memory
+        db.execute("PRAGMA temp_store = MEMORY")
         import_service = ImportService(db)
 
         results = []
 
-        for profile in self.profiles_to_import:
-            if self._is_cancelled:
-                break
-
-            profile_name = profile.profile_name or profile.profile_id
-            self.profile_started.emit(profile.browser_name, profile_name)
+        total_bookmarks = sum(profile.bookmark_count for profile in self.profiles_to_import)
+        deferred_indexes = []
+        if total_bookmarks > self._LARGE_IMPORT_BOOKMARKS:
+            deferred_indexes = self._drop_deferred_indexes(db)
+
+        # Bookmark files are parsed on a few threads ahead of the import,
+        # while this thread stays the only one writing to the database
+        profiles = iter(self.profiles_to_import)
+        max_workers = max(1, min(4, len(self.profiles_to_import)))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+
+        def submit_next():
+            profile = next(profiles, None)
+            if profile is not None:
+                pending.append((profile, executor.submit(
+                    import_service.bookmark_parser.parse_file,
+                    profile.profile_path / "Bookmarks",
+                )))
+
+        for _ in range(max_workers):
+            submit_next()
+
+        try:
+            while pending:
+                if self._cancel_event.is_set():
+                    break
+
+                profile, parsed = pending.popleft()
+                submit_next()
 
-            try:
-                result = import_service.import_profile(
-                    profile,
-                    progress_callback=self._on_progress
-                )
-                results.append(result)
-                self.profile_finished.emit(result)
-            except Exception as e:
-                self.error_occurred.emit(f"Error importing {profile.browser_name}/{profile_name}: {e}")
+                profile_name = profile.profile_name or profile.profile_id
+                self.profile_started.emit(profile.browser_name, profile_name)
+
+                try:
+                    # One commit per profile instead of one per bookmark; a failed
+                    # profile is rolled back without losing the ones before it
+                    with db.transaction():
+                        result = import_service.import_profile(
+                            profile,
+                            progress_callback=self._on_progress,
+                            batch_size=500,
+                            parse=parsed.result,
+                            cancel_event=self._cancel_event,
+                        )
+                    results.append(result)
+                    self.profile_finished.emit(result)
+                except ImportCancelled:
+                    # The transaction has rolled the partial profile back
+                    break
+                except Exception as e:
+                    self.error_occurred.emit(f"Error importing {profile.browser_name}/{profile_name}: {e}")
+        finally:
+            executor.shutdown(cancel_futures=True)
+            if deferred_indexes:
+                with db.transaction():
+                    for sql in deferred_indexes:
+                        db.execute(sql)
 
         # Close the thread's database connection
         db.close()
@@ -70,12 +148,25 @@ class ImportWorker(QThread):
 
     def _on_progress(self, progress: ImportProgress):
         """Handle progress updates from the import service."""
-        if not self._is_cancelled:
-            self.progress_updated.emit(progress)
+        if self._cancel_event.is_set():
+            return
+        # Throttle by time, but never drop a phase change or the last item
+        now = time.monotonic()
+        if (
+            now - self._last_emit >= self._PROGRESS_INTERVAL
+            or progress.phase != self._last_phase
+            or progress.current_item == progress.total_items
+        ):
+            self._last_emit = now
+            self._last_phase = progress.phase
+            self.progress_updated.emit(
+                progress.phase, progress.current_item, progress.total_items,
+                progress.current_title or "",
+            )
 
     def cancel(self):
         """Cancel the import operation."""
-        self._is_cancelled = True
+        self._cancel_event.set()
 
 
 class ImportDialog(QDialog):
@@ -83,9 +174,13 @@ class ImportDialog(QDialog):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.profile_detector = ProfileDetector()
+        self.profile_detector = get_profile_detector()
         self.worker = None
         self.results = []
+        # Summary totals, accumulated as each profile finishes
+        self._total_added = 0
+        self._total_skipped = 0
+        self._total_folders = 0
 
         # Get the database path for passing to worker thread
         from ..models.database import get_database
@@ -145,6 +240,11 @@ class ImportDialog(QDialog):
         self.current_item_label.setStyleSheet("color: gray;")
         progress_layout.addWidget(self.current_item_label)
 
+        # Last values shown by on_progress_updated, so repeated updates with
+        # the same percent or text don't touch the widgets
+        self._last_percent = 0
+        self._last_item_text = ""
+
         layout.addWidget(progress_group)
 
         # Log/results area
@@ -156,6 +256,14 @@ class ImportDialog(QDialog):
         self.log_text.setMaximumHeight(150)
         log_layout.addWidget(self.log_text)
 
+        # Log lines are buffered and appended together, so a burst of lines
+        # costs one text layout instead of one per line
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+
         layout.addWidget(log_group)
 
         # Buttons
@@ -177,11 +285,30 @@ class ImportDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _log(self, line: str):
+        """Queue a line for the import log."""
+        self._log_buf.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued lines to the import log at once."""
+        self._log_timer.stop()
+        if self._log_buf:
+            self.log_text.append("\n".join(self._log_buf))
+            self._log_buf.clear()
+
     def load_profiles(self):
         """Load available browser profiles."""
         self.profile_checkboxes = []
+        # (checkbox, profile) pairs, so reading the selection needs no
+        # round trip through Qt properties
+        self._profile_pairs = []
         profiles = self.profile_detector.detect_all_profiles()
 
+        # Lay the checkboxes out once, after they are all added
+        self.profile_container.setUpdatesEnabled(False)
+        self.profile_layout.setEnabled(False)
         for profile in profiles:
             if profile.has_bookmarks_file:
                 profile_name = profile.profile_name or profile.profile_id
@@ -189,39 +316,39 @@ class ImportDialog(QDialog):
 
                 checkbox = QCheckBox(label)
                 checkbox.setChecked(True)
-                checkbox.setProperty("profile", profile)
                 self.profile_checkboxes.append(checkbox)
+                self._profile_pairs.append((checkbox, profile))
                 self.profile_layout.addWidget(checkbox)
+        self.profile_layout.setEnabled(True)
+        self.profile_container.setUpdatesEnabled(True)
 
         # Update select all state
         self.select_all_checkbox.setChecked(True)
 
         if not self.profile_checkboxes:
-            self.log_text.append("No browser profiles with bookmarks found.")
+            self._log("No browser profiles with bookmarks found.")
             self.import_button.setEnabled(False)
 
     def on_select_all_changed(self, state):
         """Handle select all checkbox change."""
         is_checked = state == Qt.CheckState.Checked.value
+        # Nothing needs a stateChanged per profile checkbox; the selection
+        # is read when the import starts
         for checkbox in self.profile_checkboxes:
+            checkbox.blockSignals(True)
             checkbox.setChecked(is_checked)
+            checkbox.blockSignals(False)
 
     def get_selected_profiles(self) -> list:
         """Get list of selected profiles."""
-        selected = []
-        for checkbox in self.profile_checkboxes:
-            if checkbox.isChecked():
-                profile = checkbox.property("profile")
-                if profile:
-                    selected.append(profile)
-        return selected
+        return [profile for checkbox, profile in self._profile_pairs if checkbox.isChecked()]
 
     def start_import(self):
         """Start the import process."""
         selected_profiles = self.get_selected_profiles()
 
         if not selected_profiles:
-            self.log_text.append("No profiles selected.")
+            self._log("No profiles selected.")
             return
 
         # Disable UI during import
@@ -232,8 +359,10 @@ class ImportDialog(QDialog):
 
         # Clear previous results
         self.results = []
+        self._total_added = self._total_skipped = self._total_folders = 0
+        self._log_buf.clear()
         self.log_text.clear()
-        self.log_text.append(f"Starting import of {len(selected_profiles)} profile(s)...\n")
+        self._log(f"Starting import of {len(selected_profiles)} profile(s)...\n")
 
         # Create and start worker thread
         self.worker = ImportWorker(selected_profiles, self.db_path)
@@ -244,38 +373,46 @@ class ImportDialog(QDialog):
         self.worker.error_occurred.connect(self.on_error)
         self.worker.start()
 
-    def on_progress_updated(self, progress: ImportProgress):
+    def on_progress_updated(self, phase: str, current_item: int, total_items: int, title: str):
         """Handle progress updates."""
-        if progress.total_items > 0:
-            percent = int((progress.current_item / progress.total_items) * 100)
-            self.progress_bar.setValue(percent)
+        if total_items > 0:
+            percent = int((current_item / total_items) * 100)
+            if percent != self._last_percent:
+                self.progress_bar.setValue(percent)
+                self._last_percent = percent
 
         # Truncate title for display
-        title = progress.current_title
         if len(title) > 50:
             title = title[:47] + "..."
 
-        self.current_item_label.setText(f"{progress.phase}: {title}")
+        text = f"{phase}: {title}"
+        if text != self._last_item_text:
+            self.current_item_label.setText(text)
+            self._last_item_text = text
 
     def on_profile_started(self, browser_name: str, profile_name: str):
         """Handle profile import start."""
         self.current_profile_label.setText(f"Importing: {browser_name} - {profile_name}")
         self.progress_bar.setValue(0)
-        self.log_text.append(f"Importing {browser_name} - {profile_name}...")
+        self._last_percent = 0
+        self._log(f"Importing {browser_name} - {profile_name}...")
 
     def on_profile_finished(self, result: ImportResult):
         """Handle profile import completion."""
         self.results.append(result)
+        self._total_added += result.bookmarks_added
+        self._total_skipped += result.bookmarks_skipped
+        self._total_folders += result.folders_added
 
         profile_name = result.profile.profile_display_name or result.profile.browser_profile_name
-        self.log_text.append(
+        self._log(
             f"  Completed: {result.bookmarks_added} added, "
             f"{result.bookmarks_skipped} skipped"
         )
 
         if result.errors:
             for error in result.errors:
-                self.log_text.append(f"  Error: {error}")
+                self._log(f"  Error: {error}")
 
     def on_import_finished(self, results: list):
         """Handle import completion."""
@@ -283,18 +420,17 @@ class ImportDialog(QDialog):
         self.progress_bar.setValue(100)
         self.current_profile_label.setText("Import complete!")
         self.current_item_label.setText("")
-
-        # Calculate totals
-        total_added = sum(r.bookmarks_added for r in results)
-        total_skipped = sum(r.bookmarks_skipped for r in results)
-        total_folders = sum(r.folders_added for r in results)
-
-        self.log_text.append(f"\n{'='*40}")
-        self.log_text.append(f"Import Summary:")
-        self.log_text.append(f"  Profiles processed: {len(results)}")
-        self.log_text.append(f"  Bookmarks added: {total_added}")
-        self.log_text.append(f"  Bookmarks skipped: {total_skipped}")
-        self.log_text.append(f"  Folders added: {total_folders}")
+        self._last_percent = 100
+        self._last_item_text = ""
+
+        # Totals were accumulated in on_profile_finished
+        self._log(f"\n{'='*40}")
+        self._log(f"Import Summary:")
+        self._log(f"  Profiles processed: {len(results)}")
+        self._log(f"  Bookmarks added: {self._total_added}")
+        self._log(f"  Bookmarks skipped: {self._total_skipped}")
+        self._log(f"  Folders added: {self._total_folders}")
+        self._flush_log()
 
         # Show close button, hide cancel
         self.cancel_button.setVisible(False)
@@ -303,14 +439,14 @@ class ImportDialog(QDialog):
 
     def on_error(self, error_message: str):
         """Handle error during import."""
-        self.log_text.append(f"ERROR: {error_message}")
+        self._log(f"ERROR: {error_message}")
 
     def on_cancel(self):
         """Handle cancel button click."""
         if self.worker and self.worker.isRunning():
             self.worker.cancel()
             self.worker.wait()
-            self.log_text.append("\nImport cancelled by user.")
+            self._log("\nImport cancelled by user.")
 
         self.reject()
 
@@ -1,5 +1,8 @@
 """Main application window for the Bookmark Manager."""
 
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -8,8 +11,7 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QTreeWidget,
     QTreeWidgetItem,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QLineEdit,
     QLabel,
     QHeaderView,
@@ -23,8 +25,8 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QGroupBox,
 )
-from PyQt6.QtCore import Qt, QUrl, QSize
-from PyQt6.QtGui import QAction, QDesktopServices, QColor, QPixmap
+from PyQt6.QtCore import Qt, QUrl, QSize, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QAction, QDesktopServices, QBrush, QColor, QPixmap
 
 from ..models.database import get_database, reset_database
 from ..models.bookmark import Bookmark
@@ -39,9 +41,140 @@ from .thumbnail_dialog import ThumbnailDialog
 from ..services.thumbnail_service import get_thumbnail_service
 
 
+class BookmarkTableModel(QAbstractTableModel):
+    """Table model over the bookmarks shown in the main window.
+
+    Cell values are produced on demand in data(), so only the rows the view
+    actually paints are materialized.
+    """
+
+    HEADERS = ["Title", "URL", "Folder", "Browser/Profile", "Dead", "Exact Dup", "Similar"]
+
+    # Shared brushes for the flag columns, created once rather than per cell
+    _RED_BRUSH = QBrush(QColor(255, 0, 0))
+    _ORANGE_BRUSH = QBrush(QColor(255, 140, 0))
+    _BLUE_BRUSH = QBrush(QColor(0, 100, 200))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bookmarks: List[Bookmark] = []
+        self._folder_names: Dict[int, str] = {}
+        self._profile_names: Dict[int, str] = {}
+        self._dead_link_ids: Set[int] = set()
+        # Cell text of the duplicate columns, only for bookmarks whose group
+        # has more than one member
+        self._exact_text: Dict[int, str] = {}
+        self._similar_text: Dict[int, str] = {}
+
+    def set_bookmarks(
+        self,
+        bookmarks: List[Bookmark],
+        folder_names: Dict[int, str],
+        profile_names: Dict[int, str],
+    ):
+        """Replace the displayed bookmarks.
+
+        Args:
+            bookmarks: Bookmarks to show, in display order
+            folder_names: Folder name by folder ID
+            profile_names: "Browser/Profile" text by browser profile ID
+        """
+        self.beginResetModel()
+        self._bookmarks = bookmarks
+        self._folder_names = folder_names
+        self._profile_names = profile_names
+        self.endResetModel()
+
+    def set_status(
+        self,
+        dead_link_ids: Set[int],
+        exact_counts: Dict[int, int],
+        similar_counts: Dict[int, int],
+    ):
+        """Set the dead link and duplicate data shown in the flag columns.
+
+        The duplicate counts are turned into cell text here, once, so data()
+        does a single lookup per painted cell.
+        """
+        self._dead_link_ids = dead_link_ids
+        self._exact_text = {
+            bookmark_id: str(count) for bookmark_id, count in exact_counts.items() if count > 1
+        }
+        self._similar_text = {
+            bookmark_id: str(count) for bookmark_id, count in similar_counts.items() if count > 1
+        }
+        if self._bookmarks:
+            self.dataChanged.emit(
+                self.index(0, 4), self.index(len(self._bookmarks) - 1, 6)
+            )
+
+    def bookmark_at(self, row: int) -> Optional[Bookmark]:
+        """Get the bookmark shown at a row."""
+        if 0 <= row < len(self._bookmarks):
+            return self._bookmarks[row]
+        return None
+
+    def folder_name(self, bookmark: Bookmark) -> str:
+        """Get the folder name shown for a bookmark."""
+        if bookmark.folder_id:
+            return self._folder_names.get(bookmark.folder_id, "")
+        return ""
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._bookmarks)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        bookmark = self._bookmarks[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return bookmark.title or "(no title)"
+            elif col == 1:
+                return bookmark.url
+            elif col == 2:
+                return self.folder_name(bookmark)
+            elif col == 3:
+                if bookmark.browser_profile_id:
+                    return self._profile_names.get(bookmark.browser_profile_id, "")
+                return ""
+            elif col == 4:
+                return "X" if bookmark.bookmark_id in self._dead_link_ids else ""
+            elif col == 5:
+                return self._exact_text.get(bookmark.bookmark_id, "")
+            elif col == 6:
+                return self._similar_text.get(bookmark.bookmark_id, "")
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if col == 4:
+                if bookmark.bookmark_id in self._dead_link_ids:
+                    return self._RED_BRUSH
+            elif col == 5:
+                if bookmark.bookmark_id in self._exact_text:
+                    return self._ORANGE_BRUSH
+            elif col == 6:
+                if bookmark.bookmark_id in self._similar_text:
+                    return self._BLUE_BRUSH
+        elif role == Qt.ItemDataRole.UserRole:
+            return bookmark.bookmark_id
+        return None
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Number of scaled preview thumbnails kept for re-selected bookmarks
+    _SCALED_THUMBNAIL_LIMIT = 64
+
     def __init__(self):
         super().__init__()
         self.db = get_database()
@@ -53,6 +186,21 @@ class MainWindow(QMainWindow):
         self.dead_link_bookmark_ids = set()
         self.exact_duplicate_counts = {}
         self.similar_duplicate_counts = {}
+        # Bookmarks in an exact duplicate group of more than one, counted
+        # once per load_status_data for the status bar
+        self._exact_dup_count = 0
+
+        # Total bookmark count for the status bar, and all bookmarks in
+        # Bookmark.get_all order for the folder/profile views; None until
+        # loaded and after anything that may add or delete bookmarks
+        self._total_bookmarks = None
+        self._all_bookmarks: Optional[List[Bookmark]] = None
+        # Folder and profile names shown in the table, by ID; loaded with
+        # the bookmarks and dropped with them
+        self._display_names: Optional[Tuple[Dict[int, str], Dict[int, str]]] = None
+
+        # What the folder tree was last built from, to skip identical rebuilds
+        self._folder_tree_key: Optional[tuple] = None
 
         # Thumbnail service
         self.thumbnail_service = get_thumbnail_service()
@@ -63,6 +211,23 @@ class MainWindow(QMainWindow):
         # Currently selected bookmark URL for thumbnail
         self.selected_url = None
 
+        # Smoothly scaled thumbnails by (url, width, height), least recently
+        # shown first, so re-selecting a bookmark skips the rescale
+        self._scaled_thumbnails: Dict[Tuple[str, int, int], QPixmap] = OrderedDict()
+
+        # Search runs once the user pauses typing, not on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(300)
+        self._search_timer.timeout.connect(self._do_search)
+
+        # The preview follows the selection once it settles, so scrolling
+        # through rows with the arrow keys doesn't load every thumbnail
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(75)
+        self._selection_timer.timeout.connect(self._do_selection_update)
+
         self.setup_ui()
         self.load_status_data()
         self.load_data()
@@ -107,11 +272,9 @@ class MainWindow(QMainWindow):
         main_splitter.addWidget(self.folder_tree)
 
         # Middle - bookmark table
-        self.bookmark_table = QTableWidget()
-        self.bookmark_table.setColumnCount(7)
-        self.bookmark_table.setHorizontalHeaderLabels([
-            "Title", "URL", "Folder", "Browser/Profile", "Dead", "Exact Dup", "Similar"
-        ])
+        self.bookmark_model = BookmarkTableModel(self)
+        self.bookmark_table = QTableView()
+        self.bookmark_table.setModel(self.bookmark_model)
 
         # All columns interactive (resizable)
         for i in range(7):
@@ -126,12 +289,16 @@ class MainWindow(QMainWindow):
         self.bookmark_table.setColumnWidth(5, 70)   # Exact Dup
         self.bookmark_table.setColumnWidth(6, 60)   # Similar
 
-        self.bookmark_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.bookmark_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.bookmark_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.bookmark_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.bookmark_table.doubleClicked.connect(self.on_bookmark_double_clicked)
         self.bookmark_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.bookmark_table.customContextMenuRequested.connect(self.show_bookmark_context_menu)
-        self.bookmark_table.itemSelectionChanged.connect(self.on_bookmark_selection_changed)
+        self.bookmark_table.selectionModel().selectionChanged.connect(self.on_bookmark_selection_changed)
+        # A model reset drops the selection without emitting selectionChanged
+        self.bookmark_model.modelReset.connect(self._clear_preview)
+        # Only the shown count changes when the table is reloaded
+        self.bookmark_model.modelReset.connect(self._show_status_message)
         main_splitter.addWidget(self.bookmark_table)
 
         # Right sidebar - thumbnail preview
@@ -224,30 +391,35 @@ class MainWindow(QMainWindow):
         return panel
 
     def on_bookmark_selection_changed(self):
-        """Handle bookmark selection change - update preview panel."""
+        """Handle bookmark selection change, restarting the preview delay."""
+        self._selection_timer.start()
+
+    def _do_selection_update(self):
+        """Update the preview panel for the current selection."""
+        self._selection_timer.stop()
         selected_rows = self.bookmark_table.selectionModel().selectedRows()
         if not selected_rows:
             self._clear_preview()
             return
 
-        row = selected_rows[0].row()
-        title_item = self.bookmark_table.item(row, 0)
-        url_item = self.bookmark_table.item(row, 1)
-        folder_item = self.bookmark_table.item(row, 2)
-
-        if not url_item:
+        bookmark = self.bookmark_model.bookmark_at(selected_rows[0].row())
+        if bookmark is None:
             self._clear_preview()
             return
 
-        url = url_item.text()
-        title = title_item.text() if title_item else "(no title)"
-        folder = folder_item.text() if folder_item else ""
+        url = bookmark.url
+        title = bookmark.title or "(no title)"
+        folder = self.bookmark_model.folder_name(bookmark)
 
         self.selected_url = url
 
         # Update info labels
         self.preview_title_label.setText(title)
-        self.preview_url_label.setText(url[:100] + "..." if len(url) > 100 else url)
+        # Elide to the label's actual width rather than a fixed length
+        metrics = self.preview_url_label.fontMetrics()
+        self.preview_url_label.setText(metrics.elidedText(
+            url, Qt.TextElideMode.ElideRight, max(50, self.preview_url_label.width())
+        ))
         self.preview_url_label.setToolTip(url)
         self.preview_folder_label.setText(f"📁 {folder}" if folder else "")
 
@@ -288,16 +460,30 @@ class MainWindow(QMainWindow):
 
         # Scale to fit the label while maintaining aspect ratio
         label_size = self.thumbnail_label.size()
-        scaled = pixmap.scaled(
-            label_size.width() - 10,
-            label_size.height() - 10,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        key = (self.selected_url, label_size.width(), label_size.height())
+        scaled = self._scaled_thumbnails.get(key)
+        if scaled is None:
+            scaled = pixmap.scaled(
+                label_size.width() - 10,
+                label_size.height() - 10,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._scaled_thumbnails[key] = scaled
+            if len(self._scaled_thumbnails) > self._SCALED_THUMBNAIL_LIMIT:
+                self._scaled_thumbnails.popitem(last=False)
+        else:
+            self._scaled_thumbnails.move_to_end(key)
         self.thumbnail_label.setPixmap(scaled)
 
+    def _forget_scaled_thumbnail(self, url: str):
+        """Drop the scaled thumbnails of a URL whose image is being replaced."""
+        for key in [key for key in self._scaled_thumbnails if key[0] == url]:
+            del self._scaled_thumbnails[key]
+
     def on_thumbnail_ready(self, url: str, pixmap: QPixmap):
         """Handle thumbnail generation complete."""
+        self._forget_scaled_thumbnail(url)
         if url == self.selected_url:
             self._display_thumbnail(pixmap)
             self.preview_status_label.setText("Thumbnail generated")
@@ -327,6 +513,7 @@ class MainWindow(QMainWindow):
     def _refresh_thumbnail(self):
         """Refresh the thumbnail for the selected URL."""
         if self.selected_url:
+            self._forget_scaled_thumbnail(self.selected_url)
             self.thumbnail_label.setText("Refreshing preview...")
             self.preview_status_label.setText("Regenerating...")
             self.thumbnail_service.get_thumbnail(self.selected_url, force_refresh=True)
@@ -420,50 +607,56 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # Load exact duplicate counts (from most recent check)
-        self.exact_duplicate_counts = {}
-        try:
-            cursor = self.db.execute("""
-                SELECT dgm.bookmark_id,
-                       (SELECT COUNT(*) FROM duplicate_group_members dgm2
-                        WHERE dgm2.duplicate_group_id = dgm.duplicate_group_id) as group_size
-                FROM duplicate_group_members dgm
-                JOIN duplicate_groups dg ON dgm.duplicate_group_id = dg.duplicate_group_id
-                WHERE dg.match_type = 'exact'
-                AND dg.check_run_id = (
-                    SELECT check_run_id FROM duplicate_groups
-                    WHERE match_type = 'exact'
-                    ORDER BY created_at DESC LIMIT 1
-                )
-            """)
-            for row in cursor.fetchall():
-                self.exact_duplicate_counts[row['bookmark_id']] = row['group_size']
-        except Exception:
-            pass
+        # Load exact and similar duplicate counts (from most recent checks)
+        self.exact_duplicate_counts = self._load_duplicate_counts('exact')
+        self.similar_duplicate_counts = self._load_duplicate_counts('similar')
+        self._exact_dup_count = sum(1 for c in self.exact_duplicate_counts.values() if c > 1)
 
-        # Load similar duplicate counts (from most recent check)
-        self.similar_duplicate_counts = {}
+        self.bookmark_model.set_status(
+            self.dead_link_bookmark_ids,
+            self.exact_duplicate_counts,
+            self.similar_duplicate_counts,
+        )
+
+    def _load_duplicate_counts(self, match_type: str) -> Dict[int, int]:
+        """Get the group size of each bookmark in the latest duplicate check.
+
+        The latest check_run_id is looked up once, then the group sizes of
+        that run are counted in one grouped scan and joined to the members.
+
+        Args:
+            match_type: 'exact' or 'similar'
+
+        Returns:
+            Mapping from bookmark ID to the size of its duplicate group
+        """
         try:
+            latest = self.db.execute("""
+                SELECT check_run_id FROM duplicate_groups
+                WHERE match_type = ?
+                ORDER BY created_at DESC LIMIT 1
+            """, (match_type,)).fetchone()
+            if latest is None:
+                return {}
+
             cursor = self.db.execute("""
-                SELECT dgm.bookmark_id,
-                       (SELECT COUNT(*) FROM duplicate_group_members dgm2
-                        WHERE dgm2.duplicate_group_id = dgm.duplicate_group_id) as group_size
-                FROM duplicate_group_members dgm
-                JOIN duplicate_groups dg ON dgm.duplicate_group_id = dg.duplicate_group_id
-                WHERE dg.match_type = 'similar'
-                AND dg.check_run_id = (
-                    SELECT check_run_id FROM duplicate_groups
-                    WHERE match_type = 'similar'
-                    ORDER BY created_at DESC LIMIT 1
-                )
-            """)
-            for row in cursor.fetchall():
-                self.similar_duplicate_counts[row['bookmark_id']] = row['group_size']
+                SELECT dgm.bookmark_id, sizes.group_size
+                FROM (
+                    SELECT m.duplicate_group_id, COUNT(*) AS group_size
+                    FROM duplicate_group_members m
+                    JOIN duplicate_groups g ON m.duplicate_group_id = g.duplicate_group_id
+                    WHERE g.check_run_id = ? AND g.match_type = ?
+                    GROUP BY m.duplicate_group_id
+                ) sizes
+                JOIN duplicate_group_members dgm ON dgm.duplicate_group_id = sizes.duplicate_group_id
+            """, (latest['check_run_id'], match_type))
+            return {row['bookmark_id']: row['group_size'] for row in cursor.fetchall()}
         except Exception:
-            pass
+            return {}
 
     def refresh_view(self):
         """Refresh the view with latest data."""
+        self._invalidate_bookmarks()
         self.load_status_data()
         self.load_data()
 
@@ -475,15 +668,38 @@ class MainWindow(QMainWindow):
 
     def load_folder_tree(self):
         """Load the folder tree in the sidebar."""
+        # Get all profiles, and all of their folders in one query
+        profiles = BrowserProfile.get_all(self.db)
+        folders_by_profile = Folder.get_all_by_profile(self.db)
+
+        # Most refreshes follow a check or a deletion that leaves profiles and
+        # folders as they were; keep the existing items (and what the user
+        # expanded) unless something the tree shows has changed
+        tree_key = tuple(
+            (
+                profile.browser_profile_id,
+                profile.browser_name,
+                profile.profile_display_name or profile.browser_profile_name,
+                tuple(
+                    (folder.folder_id, folder.name, folder.parent_folder_id)
+                    for folder in folders_by_profile.get(profile.browser_profile_id, [])
+                ),
+            )
+            for profile in profiles
+        )
+        if tree_key == self._folder_tree_key:
+            return
+        self._folder_tree_key = tree_key
+
+        # The whole tree is built detached and inserted with one call, so the
+        # view is not notified once per folder; painting waits until the end
+        self.folder_tree.setUpdatesEnabled(False)
         self.folder_tree.clear()
 
         # Add "All Bookmarks" item at top
         all_item = QTreeWidgetItem(["All Bookmarks"])
         all_item.setData(0, Qt.ItemDataRole.UserRole, {"type": "all"})
-        self.folder_tree.addTopLevelItem(all_item)
-
-        # Get all profiles
-        profiles = BrowserProfile.get_all(self.db)
+        top_items = [all_item]
 
         for profile in profiles:
             # Create profile node
@@ -493,16 +709,18 @@ class MainWindow(QMainWindow):
                 "type": "profile",
                 "profile_id": profile.browser_profile_id
             })
-            self.folder_tree.addTopLevelItem(profile_item)
+            top_items.append(profile_item)
 
             # Get folders for this profile
-            folders = Folder.get_by_profile(self.db, profile.browser_profile_id)
+            folders = folders_by_profile.get(profile.browser_profile_id, [])
 
-            # Build folder hierarchy
+            # Build folder hierarchy. Folders are ordered by path, so a parent
+            # normally comes before its children and each folder is attached
+            # as it is created; any child seen before its parent waits in
+            # deferred until all folders exist.
             folder_items = {}
-            root_folders = []
+            deferred = []
 
-            # First pass - create all folder items
             for folder in folders:
                 folder_item = QTreeWidgetItem([folder.name])
                 folder_item.setData(0, Qt.ItemDataRole.UserRole, {
@@ -510,21 +728,24 @@ class MainWindow(QMainWindow):
                     "folder_id": folder.folder_id,
                     "profile_id": profile.browser_profile_id
                 })
-                folder_items[folder.folder_id] = (folder, folder_item)
-
-                if folder.parent_folder_id is None:
-                    root_folders.append(folder.folder_id)
+                folder_items[folder.folder_id] = folder_item
 
-            # Second pass - build hierarchy
-            for folder_id, (folder, folder_item) in folder_items.items():
                 if folder.parent_folder_id is None:
                     profile_item.addChild(folder_item)
                 elif folder.parent_folder_id in folder_items:
-                    parent_item = folder_items[folder.parent_folder_id][1]
-                    parent_item.addChild(folder_item)
+                    folder_items[folder.parent_folder_id].addChild(folder_item)
+                else:
+                    deferred.append((folder, folder_item))
+
+            for folder, folder_item in deferred:
+                if folder.parent_folder_id in folder_items:
+                    folder_items[folder.parent_folder_id].addChild(folder_item)
+
+        self.folder_tree.addTopLevelItems(top_items)
 
         # Expand the "All Bookmarks" item
         all_item.setExpanded(True)
+        self.folder_tree.setUpdatesEnabled(True)
 
     def load_bookmarks(self, folder_id=None, profile_id=None, search_query=None):
         """Load bookmarks into the table.
@@ -534,86 +755,58 @@ class MainWindow(QMainWindow):
             profile_id: Filter by profile ID, or None for all
             search_query: Search query string, or None for no search
         """
-        self.bookmark_table.setRowCount(0)
-
         if search_query:
             # Use full-text search
             bookmarks = Bookmark.search(self.db, search_query)
-        elif folder_id is not None:
-            bookmarks = Bookmark.get_by_folder(self.db, folder_id)
-        elif profile_id is not None:
-            bookmarks = Bookmark.get_by_profile(self.db, profile_id)
         else:
-            bookmarks = Bookmark.get_all(self.db)
-
-        # Get folder and profile info for display
-        folder_cache = {}
-        profile_cache = {}
-
-        for bookmark in bookmarks:
-            row = self.bookmark_table.rowCount()
-            self.bookmark_table.insertRow(row)
-
-            # Title
-            title_item = QTableWidgetItem(bookmark.title or "(no title)")
-            title_item.setData(Qt.ItemDataRole.UserRole, bookmark.bookmark_id)
-            self.bookmark_table.setItem(row, 0, title_item)
-
-            # URL
-            url_item = QTableWidgetItem(bookmark.url)
-            self.bookmark_table.setItem(row, 1, url_item)
-
-            # Folder name
-            folder_name = ""
-            if bookmark.folder_id:
-                if bookmark.folder_id not in folder_cache:
-                    folder = Folder.find_by_id(self.db, bookmark.folder_id)
-                    folder_cache[bookmark.folder_id] = folder.name if folder else ""
-                folder_name = folder_cache[bookmark.folder_id]
-            folder_item = QTableWidgetItem(folder_name)
-            self.bookmark_table.setItem(row, 2, folder_item)
-
-            # Browser/Profile
-            profile_str = ""
-            if bookmark.browser_profile_id:
-                if bookmark.browser_profile_id not in profile_cache:
-                    profile = BrowserProfile.find_by_id(self.db, bookmark.browser_profile_id)
-                    if profile:
-                        profile_cache[bookmark.browser_profile_id] = (
-                            f"{profile.browser_name}/{profile.profile_display_name or profile.browser_profile_name}"
-                        )
-                    else:
-                        profile_cache[bookmark.browser_profile_id] = ""
-                profile_str = profile_cache[bookmark.browser_profile_id]
-            profile_item = QTableWidgetItem(profile_str)
-            self.bookmark_table.setItem(row, 3, profile_item)
-
-            # Dead link flag
-            dead_item = QTableWidgetItem()
-            if bookmark.bookmark_id in self.dead_link_bookmark_ids:
-                dead_item.setText("X")
-                dead_item.setForeground(QColor(255, 0, 0))  # Red
-            self.bookmark_table.setItem(row, 4, dead_item)
-
-            # Exact duplicate count
-            exact_dup_item = QTableWidgetItem()
-            if bookmark.bookmark_id in self.exact_duplicate_counts:
-                count = self.exact_duplicate_counts[bookmark.bookmark_id]
-                if count > 1:
-                    exact_dup_item.setText(str(count))
-                    exact_dup_item.setForeground(QColor(255, 140, 0))  # Orange
-            self.bookmark_table.setItem(row, 5, exact_dup_item)
-
-            # Similar duplicate count
-            similar_dup_item = QTableWidgetItem()
-            if bookmark.bookmark_id in self.similar_duplicate_counts:
-                count = self.similar_duplicate_counts[bookmark.bookmark_id]
-                if count > 1:
-                    similar_dup_item.setText(str(count))
-                    similar_dup_item.setForeground(QColor(0, 100, 200))  # Blue
-            self.bookmark_table.setItem(row, 6, similar_dup_item)
-
-        self.update_status_bar()
+            # Folder and profile views filter the in-memory list instead of
+            # querying the database on every click
+            all_bookmarks = self._get_all_bookmarks()
+            if folder_id is not None:
+                bookmarks = [b for b in all_bookmarks if b.folder_id == folder_id]
+            elif profile_id is not None:
+                bookmarks = [b for b in all_bookmarks if b.browser_profile_id == profile_id]
+                # Same order as Bookmark.get_by_profile: the list is already
+                # by position and title, and the sort is stable; NULL first
+                bookmarks.sort(key=lambda b: (b.folder_id is not None, b.folder_id or 0))
+            else:
+                bookmarks = all_bookmarks
+
+        folder_cache, profile_cache = self._get_display_names()
+
+        # The model builds cell text and colors only for the rows the view paints
+        self.bookmark_model.set_bookmarks(bookmarks, folder_cache, profile_cache)
+
+    def _get_all_bookmarks(self) -> List[Bookmark]:
+        """Get all bookmarks, loading them once until invalidated."""
+        if self._all_bookmarks is None:
+            self._all_bookmarks = Bookmark.get_all(self.db)
+        return self._all_bookmarks
+
+    def _get_display_names(self) -> Tuple[Dict[int, str], Dict[int, str]]:
+        """Get folder and profile display names by ID, one query each."""
+        if self._display_names is None:
+            folder_names = {
+                row['folder_id']: row['name']
+                for row in self.db.execute("SELECT folder_id, name FROM folders")
+            }
+            profile_names = {
+                row['browser_profile_id']: (
+                    f"{row['browser_name']}/{row['profile_display_name'] or row['browser_profile_name']}"
+                )
+                for row in self.db.execute("""
+                    SELECT browser_profile_id, browser_name, profile_display_name, browser_profile_name
+                    FROM browser_profiles
+                """)
+            }
+            self._display_names = (folder_names, profile_names)
+        return self._display_names
+
+    def _invalidate_bookmarks(self):
+        """Forget the cached bookmarks, names and count after bookmarks changed."""
+        self._total_bookmarks = None
+        self._all_bookmarks = None
+        self._display_names = None
 
     def on_folder_clicked(self, item, column):
         """Handle folder tree item click."""
@@ -641,7 +834,13 @@ class MainWindow(QMainWindow):
             self.load_bookmarks(folder_id=self.current_folder_id)
 
     def on_search_changed(self, text):
-        """Handle search input change."""
+        """Handle search input change, restarting the search delay."""
+        self._search_timer.start()
+
+    def _do_search(self):
+        """Run the search for the current search input."""
+        self._search_timer.stop()
+        text = self.search_input.text()
         if text.strip():
             self.load_bookmarks(search_query=text.strip())
         else:
@@ -657,36 +856,33 @@ class MainWindow(QMainWindow):
 
     def on_bookmark_double_clicked(self, index):
         """Handle bookmark double-click - open URL in browser."""
-        row = index.row()
-        url_item = self.bookmark_table.item(row, 1)
-        if url_item:
-            url = url_item.text()
-            QDesktopServices.openUrl(QUrl(url))
+        bookmark = self.bookmark_model.bookmark_at(index.row())
+        if bookmark:
+            QDesktopServices.openUrl(QUrl(bookmark.url))
 
     def show_bookmark_context_menu(self, position):
         """Show context menu for bookmark table."""
-        item = self.bookmark_table.itemAt(position)
-        if item is None:
+        index = self.bookmark_table.indexAt(position)
+        if not index.isValid():
             return
 
-        row = item.row()
-        url_item = self.bookmark_table.item(row, 1)
-        title_item = self.bookmark_table.item(row, 0)
-
-        if url_item is None:
+        bookmark = self.bookmark_model.bookmark_at(index.row())
+        if bookmark is None:
             return
 
+        url = bookmark.url
+        title = bookmark.title or "(no title)"
+
         menu = QMenu(self)
 
         # Open in browser
         open_action = QAction("Open in Browser", self)
-        open_action.triggered.connect(lambda: QDesktopServices.openUrl(QUrl(url_item.text())))
+        open_action.triggered.connect(lambda: QDesktopServices.openUrl(QUrl(url)))
         menu.addAction(open_action)
 
         menu.addSeparator()
 
         # Generate/refresh thumbnail
-        url = url_item.text()
         thumb_action = QAction("Generate Thumbnail", self)
         thumb_action.triggered.connect(lambda: self._generate_thumbnail_for_url(url))
         menu.addAction(thumb_action)
@@ -695,19 +891,19 @@ class MainWindow(QMainWindow):
 
         # Copy URL
         copy_url_action = QAction("Copy URL", self)
-        copy_url_action.triggered.connect(lambda: QApplication.clipboard().setText(url_item.text()))
+        copy_url_action.triggered.connect(lambda: QApplication.clipboard().setText(url))
         menu.addAction(copy_url_action)
 
         # Copy title
-        if title_item:
-            copy_title_action = QAction("Copy Title", self)
-            copy_title_action.triggered.connect(lambda: QApplication.clipboard().setText(title_item.text()))
-            menu.addAction(copy_title_action)
+        copy_title_action = QAction("Copy Title", self)
+        copy_title_action.triggered.connect(lambda: QApplication.clipboard().setText(title))
+        menu.addAction(copy_title_action)
 
         menu.exec(self.bookmark_table.mapToGlobal(position))
 
     def _generate_thumbnail_for_url(self, url: str):
         """Generate thumbnail for a specific URL."""
+        self._forget_scaled_thumbnail(url)
         self.thumbnail_service.get_thumbnail(url, force_refresh=True)
         if url == self.selected_url:
             self.thumbnail_label.setText("Generating preview...")
@@ -719,14 +915,25 @@ class MainWindow(QMainWindow):
         self.current_folder_id = None
         self.current_profile_id = None
         self.search_input.clear()
+        # clear() scheduled a search; the view is reloaded right away instead
+        self._search_timer.stop()
         self.load_bookmarks()
 
     def update_status_bar(self):
         """Update the status bar with current stats."""
-        total = Bookmark.count(self.db)
-        shown = self.bookmark_table.rowCount()
+        if self._total_bookmarks is None:
+            self._total_bookmarks = Bookmark.count(self.db)
+        self._show_status_message()
+
+    def _show_status_message(self):
+        """Show the status bar message from the counts already loaded."""
+        total = self._total_bookmarks
+        if total is None:
+            # Bookmarks changed; update_status_bar will follow the reload
+            return
+        shown = self.bookmark_model.rowCount()
         dead_count = len(self.dead_link_bookmark_ids)
-        dup_count = len([c for c in self.exact_duplicate_counts.values() if c > 1])
+        dup_count = self._exact_dup_count
 
         if shown == total:
             msg = f"Showing all {total} bookmarks"
@@ -745,23 +952,32 @@ class MainWindow(QMainWindow):
         dialog = ImportDialog(self)
         dialog.exec()
         # Refresh data after import
+        self._invalidate_bookmarks()
         self.load_data()
 
     def show_dead_link_dialog(self):
         """Show the dead link checker dialog."""
         dialog = DeadLinkDialog(self)
+        changed = []
+        dialog.data_changed.connect(lambda: changed.append(True))
         dialog.exec()
-        # Refresh status data after check
-        self.load_status_data()
-        self.load_bookmarks()
+        # Refresh status data only if a check ran
+        if changed:
+            self.load_status_data()
+            self.load_bookmarks()
+            self.update_status_bar()
 
     def show_duplicate_dialog(self):
         """Show the duplicate finder dialog."""
         dialog = DuplicateDialog(self)
+        changed = []
+        dialog.data_changed.connect(lambda: changed.append(True))
         dialog.exec()
-        # Refresh status data after check
-        self.load_status_data()
-        self.load_bookmarks()
+        # Refresh status data only if a search ran
+        if changed:
+            self.load_status_data()
+            self.load_bookmarks()
+            self.update_status_bar()
 
     def show_refresh_all_dialog(self):
         """Show the refresh all dialog."""
@@ -769,6 +985,7 @@ class MainWindow(QMainWindow):
         dialog.database_reset.connect(self.on_database_reset)
         dialog.exec()
         # Refresh everything after
+        self._invalidate_bookmarks()
         self.load_status_data()
         self.load_data()
 
@@ -777,6 +994,7 @@ class MainWindow(QMainWindow):
         dialog = DeleteBookmarksDialog(self)
         dialog.exec()
         # Refresh everything after (bookmarks may have been deleted)
+        self._invalidate_bookmarks()
         self.load_status_data()
         self.load_data()
 
@@ -788,9 +1006,9 @@ class MainWindow(QMainWindow):
         if selected_rows:
             selected_urls = []
             for row_idx in selected_rows:
-                url_item = self.bookmark_table.item(row_idx.row(), 1)
-                if url_item:
-                    selected_urls.append(url_item.text())
+                bookmark = self.bookmark_model.bookmark_at(row_idx.row())
+                if bookmark:
+                    selected_urls.append(bookmark.url)
 
         dialog = ThumbnailDialog(selected_urls, self)
         dialog.exec()
@@ -800,6 +1018,7 @@ class MainWindow(QMainWindow):
         # Reset and get fresh database connection
         reset_database()
         self.db = get_database()
+        self._invalidate_bookmarks()
 
     def show_about(self):
         """Show about dialog."""
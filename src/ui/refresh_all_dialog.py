@@ -237,9 +237,7 @@ class RefreshAllWorker(QThread):
                 return "Cancelled"
 
             normalized = normalize_url(bookmark.url)
-            if normalized not in url_to_bookmarks:
-                url_to_bookmarks[normalized] = []
-            url_to_bookmarks[normalized].append(bookmark)
+            url_to_bookmarks.setdefault(normalized, []).append(bookmark)
 
             # Update progress every 100 bookmarks
             if i % 100 == 0:
@@ -308,9 +306,7 @@ class RefreshAllWorker(QThread):
         url_to_bookmarks = {}
         for bookmark in http_bookmarks:
             normalized = normalize_url(bookmark.url)
-            if normalized not in url_to_bookmarks:
-                url_to_bookmarks[normalized] = []
-            url_to_bookmarks[normalized].append(bookmark)
+            url_to_bookmarks.setdefault(normalized, []).append(bookmark)
 
         unique_urls = len(url_to_bookmarks)
         dead_count = 0
@@ -1,5 +1,6 @@
 """Utility functions for the bookmark manager."""
 
 from .browser_paths import get_browser_data_paths
+from .url import normalize_url
 
-__all__ = ["get_browser_data_paths"]
+__all__ = ["get_browser_data_paths", "normalize_url"]
@@ -0,0 +1,72 @@
+"""URL normalization shared by duplicate detection and bookmark storage."""
+
+import re
+from functools import lru_cache
+from urllib.parse import urlparse, parse_qs, urlencode
+
+
+# Query parameters dropped from normalized URLs
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'ref', 'source', 'mc_cid', 'mc_eid'
+})
+
+# Substrings of every tracking parameter name; a query containing none of
+# them (case-insensitively) has nothing to strip
+TRACKING_SUBSTRINGS = ('utm_', 'fbclid', 'gclid', 'ref', 'source', 'mc_cid', 'mc_eid')
+
+# Queries of plain key=value pairs that urlencode would write back unchanged,
+# so they can be sorted without the parse_qs/urlencode round trip
+_PLAIN_QUERY = re.compile(r'[\w.~-]+=[\w.~-]*(?:&[\w.~-]+=[\w.~-]*)*', re.ASCII)
+
+
+def _query_key(pair: str) -> str:
+    return pair.partition('=')[0]
+
+
+@lru_cache(maxsize=200_000)
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for exact duplicate detection.
+    - Removes trailing slashes
+    - Lowercases the domain
+    - Sorts query parameters
+    - Removes common tracking parameters
+    """
+    try:
+        parsed = urlparse(url.strip())
+
+        # Lowercase the netloc (domain)
+        netloc = parsed.netloc.lower()
+
+        # Remove www. prefix for comparison
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+
+        # Normalize path - remove trailing slash
+        path = parsed.path.rstrip('/') or '/'
+
+        # Parse and sort query parameters, removing tracking params
+        query = parsed.query
+        if not query:
+            sorted_query = ''
+        elif _PLAIN_QUERY.fullmatch(query) and not any(
+            t in query.lower() for t in TRACKING_SUBSTRINGS
+        ):
+            # Stable sort by key keeps repeated keys in order, like parse_qs
+            sorted_query = '&'.join(sorted(query.split('&'), key=_query_key))
+        else:
+            params = parse_qs(query, keep_blank_values=True)
+            # Remove tracking parameters
+            filtered_params = {k: v for k, v in params.items() if k.lower() not in _TRACKING_PARAMS}
+            # Sort and rebuild query string
+            sorted_query = urlencode(sorted(filtered_params.items()), doseq=True)
+
+        # Rebuild URL without fragment
+        normalized = f"{parsed.scheme}://{netloc}{path}"
+        if sorted_query:
+            normalized += f"?{sorted_query}"
+
+        return normalized
+    except Exception:
+        return url.strip().lower()
@@ -0,0 +1,59 @@
+"""Tests for URL normalization."""
+
+import re
+
+import pytest
+
+from src.utils import url as url_module
+from src.utils.url import normalize_url
+
+
+# Queries the plain-query fast path accepts, and a few it must hand to
+# parse_qs/urlencode
+QUERY_URLS = [
+    "https://example.com/page?b=2&a=1",
+    "https://example.com/page?a=1&b=2",
+    "https://example.com/page?a=3&b=2&a=1",
+    "https://example.com/page?z=&a=",
+    "https://example.com/page?id=42",
+    "https://example.com/page?key.name=v-1&key_name=v~2",
+    "https://example.com/page?B=1&a=2&A=3",
+    "https://example.com/page?q=hello+world&a=1",
+    "https://example.com/page?q=caf%C3%A9&a=1",
+    "https://example.com/page?q=café&a=1",
+    "https://example.com/page?flag&a=1",
+    "https://example.com/page?a=1&&b=2",
+    "https://example.com/page?a=1;b=2",
+    "https://example.com/page?a=1=2&b=3",
+    "https://example.com/page?utm_source=x&id=3",
+    "https://example.com/page?UTM_Source=x&id=3",
+    "https://example.com/page?ref=x&id=3",
+    "https://example.com/page?referrer=x&id=3",
+    "https://example.com/page?source=a&resource=b",
+    "https://example.com/page?fbclid=abc&gclid=def&mc_cid=1&mc_eid=2",
+]
+
+
+@pytest.mark.parametrize("url", QUERY_URLS)
+def test_plain_query_fast_path_matches_parse_qs(url, monkeypatch):
+    fast = normalize_url.__wrapped__(url)
+    monkeypatch.setattr(url_module, "_PLAIN_QUERY", re.compile(r"(?!)"))
+    assert fast == normalize_url.__wrapped__(url)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://WWW.Example.COM/Path/", "https://example.com/Path"),
+    ("http://example.com", "http://example.com/"),
+    ("https://example.com/page#section", "https://example.com/page"),
+    ("  https://example.com/page  ", "https://example.com/page"),
+    ("https://example.com/page?b=2&a=1", "https://example.com/page?a=1&b=2"),
+    ("https://example.com/page?utm_source=x&utm_medium=y", "https://example.com/page"),
+    ("https://example.com/page?id=3&ref=x", "https://example.com/page?id=3"),
+])
+def test_normalize_url(url, expected):
+    assert normalize_url(url) == expected
+
+
+def test_tracking_substrings_cover_tracking_params():
+    for param in url_module._TRACKING_PARAMS:
+        assert any(t in param for t in url_module.TRACKING_SUBSTRINGS)